@@ -0,0 +1,29 @@
+/**
+ * Base calculator class
+ * 
+ * Provides common functionality for all calculators
+ */
+
+import { Logger } from "../utils/logger";
+
+export abstract class BaseCalculator {
+  protected readonly logger?: Logger;
+
+  constructor(logger?: Logger) {
+    this.logger = logger;
+  }
+
+  /**
+   * Logs a message if logger is available
+   */
+  protected log(message: string, data?: any): void {
+    this.logger?.info(message, data);
+  }
+
+  /**
+   * Logs a detail message at debug level if logger is available
+   */
+  protected debug(message: string, data?: any): void {
+    this.logger?.debug(message, data);
+  }
+}
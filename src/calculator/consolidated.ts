@@ -5,7 +5,12 @@
  * including total rewards, activity metrics, and distribution charts data.
  */
 
-import { Logger } from "../utils/logger";
+import { BaseCalculator } from "./base";
+import { REWARD_TIERS } from "./rewards";
+
+// Display position of each tier name (Diamond first), derived from the reward tier table
+const TIER_ORDER = new Map(REWARD_TIERS.map((tier, index) => [tier.name, index] as const));
+const UNKNOWN_TIER_ORDER = REWARD_TIERS.length; // Unknown tier names sort last
 
 /**
  * Interface for project result data coming from main processing
@@ -20,9 +25,11 @@ export interface ProjectResult {
   metrics_onchain?: any;
   rewards_onchain?: any;
   rawdata_onchain?: any;
+  rawdata_onchain_s3?: string; // S3 key of the raw on-chain data when stored separately
   metrics_offchain?: any;
   rewards_offchain?: any;
   rawdata_offchain?: any;
+  rawdata_offchain_s3?: string; // S3 key of the raw off-chain data when stored separately
   rewards_total?: any;
   error?: string;
 }
@@ -110,22 +117,7 @@ export interface ConsolidatedDashboardData {
 /**
  * Main Consolidated Calculator Class
  */
-export class ConsolidatedCalculator {
-  private readonly logger?: Logger;
-
-  constructor(logger?: Logger) {
-    this.logger = logger;
-  }
-
-  /**
-   * Logs a message if logger is available
-   */
-  private log(message: string, data?: any): void {
-    if (this.logger) {
-      this.logger.info(message, data);
-    }
-  }
-
+export class ConsolidatedCalculator extends BaseCalculator {
   /**
    * Calculates consolidated dashboard data from all project results
    */
@@ -417,12 +409,9 @@ export class ConsolidatedCalculator {
     }));
 
     // Sort by tier hierarchy (Diamond first, then Gold, etc.)
-    const tierOrder = ['Diamond', 'Gold', 'Silver', 'Bronze', 'Contributor', 'Explorer', 'Member'];
-    distribution.sort((a, b) => {
-      const aIndex = tierOrder.indexOf(a.tier);
-      const bIndex = tierOrder.indexOf(b.tier);
-      return (aIndex === -1 ? 999 : aIndex) - (bIndex === -1 ? 999 : bIndex);
-    });
+    distribution.sort((a, b) =>
+      (TIER_ORDER.get(a.tier) ?? UNKNOWN_TIER_ORDER) - (TIER_ORDER.get(b.tier) ?? UNKNOWN_TIER_ORDER)
+    );
 
     return distribution;
   }
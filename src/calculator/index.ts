@@ -2,6 +2,7 @@
  * Calculator module exports
  */
 
+export * from './base';
 export * from './onchain';
 export * from './offchain';
 export * from './rewards';
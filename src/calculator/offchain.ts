@@ -8,14 +8,36 @@
 
 import { GitHubMetrics } from "../types/metrics";
 import { OffchainScoreBreakdown, OffchainCalculationResult } from "../types/rewards";
-import { Logger } from "../utils/logger";
+import { BaseCalculator } from "./base";
+
+// Sections every GitHub metrics object must carry, checked by validateMetrics
+const REQUIRED_METRIC_FIELDS: readonly (keyof GitHubMetrics)[] = ['commits', 'pullRequests', 'reviews', 'issues', 'metadata'];
 
 /**
- * NEAR Off-chain Calculator Class
+ * Creates zeroed GitHub metrics for a project's combined repositories
  */
-export class OffchainCalculator {
-  private readonly logger?: Logger;
+function createEmptyCombinedMetrics(): GitHubMetrics {
+  return {
+    commits: {
+      count: 0,
+      frequency: { daily: new Array(7).fill(0), weekly: 0, monthly: 0 },
+      authors: []
+    },
+    pullRequests: { open: 0, merged: 0, closed: 0, authors: [] },
+    reviews: { count: 0, authors: [] },
+    issues: { open: 0, closed: 0, participants: [] },
+    metadata: {
+      collectionTimestamp: Date.now(),
+      source: "github",
+      projectId: "combined"
+    }
+  };
+}
 
+/**
+ * NEAR Off-chain Calculator Class
+ */
+export class OffchainCalculator extends BaseCalculator {
   // Thresholds for maximum points (based on cohort 2 requirements)
   private readonly thresholds = {
     commits: 100,      // 100 meaningful commits for max points
@@ -33,19 +55,6 @@ export class OffchainCalculator {
     total: 80           // 80 points total for off-chain
   };
 
-  constructor(logger?: Logger) {
-    this.logger = logger;
-  }
-
-  /**
-   * Logs a message if logger is available
-   */
-  private log(message: string, data?: any): void {
-    if (this.logger) {
-      this.logger.info(message, data);
-    }
-  }
-
   /**
    * Calculates commits score based on total commits and author diversity
    */
@@ -60,7 +69,7 @@ export class OffchainCalculator {
     const score = (countScore + authorDiversityBonus) * this.maxPoints.commits;
     const finalScore = Math.min(score, this.maxPoints.commits);
     
-    this.log(`📝 Commits Score:`, {
+    this.debug(`📝 Commits Score:`, {
       totalCommits: commits.count,
       authors: commits.authors.length,
       threshold: this.thresholds.commits,
@@ -87,7 +96,7 @@ export class OffchainCalculator {
     const score = (countScore + authorDiversityBonus) * this.maxPoints.pullRequests;
     const finalScore = Math.min(score, this.maxPoints.pullRequests);
     
-    this.log(`🔀 Pull Requests Score:`, {
+    this.debug(`🔀 Pull Requests Score:`, {
       merged: mergedPRs,
       open: pullRequests.open,
       closed: pullRequests.closed,
@@ -114,7 +123,7 @@ export class OffchainCalculator {
     const score = (countScore + reviewerDiversityBonus) * this.maxPoints.reviews;
     const finalScore = Math.min(score, this.maxPoints.reviews);
     
-    this.log(`👀 Reviews Score:`, {
+    this.debug(`👀 Reviews Score:`, {
       totalReviews: reviews.count,
       reviewers: reviews.authors.length,
       threshold: this.thresholds.reviews,
@@ -141,7 +150,7 @@ export class OffchainCalculator {
     const score = (countScore + participantDiversityBonus) * this.maxPoints.issues;
     const finalScore = Math.min(score, this.maxPoints.issues);
     
-    this.log(`🐛 Issues Score:`, {
+    this.debug(`🐛 Issues Score:`, {
       closed: closedIssues,
       open: issues.open,
       participants: issues.participants.length,
@@ -162,35 +171,10 @@ export class OffchainCalculator {
 
     if (repositoriesMetrics.length === 0) {
       this.log("⚠️ No repository data to combine");
-      return {
-        commits: { count: 0, frequency: { daily: new Array(7).fill(0), weekly: 0, monthly: 0 }, authors: [] },
-        pullRequests: { open: 0, merged: 0, closed: 0, authors: [] },
-        reviews: { count: 0, authors: [] },
-        issues: { open: 0, closed: 0, participants: [] },
-        metadata: {
-          collectionTimestamp: Date.now(),
-          source: "github",
-          projectId: "combined"
-        }
-      };
+      return createEmptyCombinedMetrics();
     }
 
-    // Initialize combined metrics
-    const combinedMetrics: GitHubMetrics = {
-      commits: {
-        count: 0,
-        frequency: { daily: new Array(7).fill(0), weekly: 0, monthly: 0 },
-        authors: []
-      },
-      pullRequests: { open: 0, merged: 0, closed: 0, authors: [] },
-      reviews: { count: 0, authors: [] },
-      issues: { open: 0, closed: 0, participants: [] },
-      metadata: {
-        collectionTimestamp: Date.now(),
-        source: "github",
-        projectId: "combined"
-      }
-    };
+    const combinedMetrics = createEmptyCombinedMetrics();
 
     // Track unique authors across all repositories
     const commitAuthorsMap = new Map<string, number>();
@@ -222,20 +206,26 @@ export class OffchainCalculator {
       combinedMetrics.pullRequests.open += repoMetrics.pullRequests.open;
       combinedMetrics.pullRequests.merged += repoMetrics.pullRequests.merged;
       combinedMetrics.pullRequests.closed += repoMetrics.pullRequests.closed;
-      repoMetrics.pullRequests.authors.forEach(author => prAuthorsSet.add(author));
+      for (const author of repoMetrics.pullRequests.authors) {
+        prAuthorsSet.add(author);
+      }
 
       // Combine reviews
       combinedMetrics.reviews.count += repoMetrics.reviews.count;
-      repoMetrics.reviews.authors.forEach(author => reviewAuthorsSet.add(author));
+      for (const author of repoMetrics.reviews.authors) {
+        reviewAuthorsSet.add(author);
+      }
 
       // Combine issues
       combinedMetrics.issues.open += repoMetrics.issues.open;
       combinedMetrics.issues.closed += repoMetrics.issues.closed;
-      repoMetrics.issues.participants.forEach(participant => issueParticipantsSet.add(participant));
+      for (const participant of repoMetrics.issues.participants) {
+        issueParticipantsSet.add(participant);
+      }
     }
 
     // Convert maps/sets back to arrays
-    combinedMetrics.commits.authors = Array.from(commitAuthorsMap.entries()).map(([login, count]) => ({
+    combinedMetrics.commits.authors = Array.from(commitAuthorsMap, ([login, count]) => ({
       login,
       count
     }));
@@ -300,9 +290,7 @@ export class OffchainCalculator {
    * Validates GitHub metrics data
    */
   validateMetrics(metrics: GitHubMetrics): boolean {
-    const requiredFields = ['commits', 'pullRequests', 'reviews', 'issues', 'metadata'];
-
-    for (const field of requiredFields) {
+    for (const field of REQUIRED_METRIC_FIELDS) {
       if (!(field in metrics)) {
         this.log(`❌ Validation failed: Missing field '${field}'`);
         return false;
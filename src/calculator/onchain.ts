@@ -6,16 +6,123 @@
  * data for the main rewards calculator.
  */
 
-import { OnchainMetrics, NearTransactionData } from "../types/metrics";
+import { OnchainMetrics, NearTransactionData, NearTransaction, YoctoAmount } from "../types/metrics";
 import { OnchainScoreBreakdown, OnchainCalculationResult } from "../types/rewards";
-import { Logger } from "../utils/logger";
+import { BaseCalculator } from "./base";
+
+const YOCTO_PER_NEAR = 10n ** 24n;
+const INTEGER_PATTERN = /^\d+$/;
+const FUNCTION_CALL_ACTION = "FUNCTION_CALL"; // NearBlocks action kind for contract method calls
+
+// Numeric fields every on-chain metrics object must carry, checked by validateMetrics
+const REQUIRED_METRIC_FIELDS: readonly (keyof OnchainMetrics)[] = [
+  'transactionVolume',
+  'contractInteractions',
+  'uniqueWallets',
+  'transactionCount'
+];
 
 /**
- * NEAR On-chain Calculator Class
+ * Converts a yoctoNEAR amount to an exact integer
  */
-export class OnchainCalculator {
-  private readonly logger?: Logger;
+function toYocto(amount: YoctoAmount | null | undefined): bigint {
+  if (typeof amount === 'string' && INTEGER_PATTERN.test(amount)) {
+    return BigInt(amount);
+  }
+  const value = Number(amount);
+  return Number.isFinite(value) ? BigInt(Math.trunc(value)) : 0n;
+}
+
+/**
+ * Converts an exact yoctoNEAR total to NEAR, splitting off whole NEAR first to keep precision
+ */
+function yoctoToNear(amount: bigint): number {
+  return Number(amount / YOCTO_PER_NEAR) + Number(amount % YOCTO_PER_NEAR) / Number(YOCTO_PER_NEAR);
+}
+
+/**
+ * Folds transactions into on-chain metrics incrementally, so metrics can be
+ * updated page by page while transactions are still being fetched
+ */
+export class OnchainMetricsAccumulator {
+  private readonly accountId: string;
+  private totalVolume = 0n; // Exact sum in yoctoNEAR
+  private contractInteractions = 0;
+  private transactionCount = 0;
+  // Counterparties are added unconditionally; the account itself and missing ids are excluded when reading
+  private readonly wallets = new Set<string | null | undefined>();
+
+  constructor(accountId: string) {
+    this.accountId = accountId;
+  }
+
+  /**
+   * Adds a batch of transactions in a single pass
+   */
+  addTransactions(transactions: readonly NearTransaction[]): void {
+    let totalVolume = this.totalVolume;
+    let contractInteractions = this.contractInteractions;
+    const wallets = this.wallets;
+
+    for (let i = 0; i < transactions.length; i++) {
+      const tx = transactions[i];
+
+      // Volume calculation - prefer the actions_agg total, fall back to summing action deposits
+      const aggregatedDeposit = tx.actions_agg?.deposit;
+      const sumActionDeposits = aggregatedDeposit === undefined || aggregatedDeposit === null;
+      if (!sumActionDeposits) {
+        totalVolume += toYocto(aggregatedDeposit);
+      }
+
+      // One scan over the actions counts contract interactions (and sums deposits when needed)
+      const actions = tx.actions || [];
+      for (let j = 0; j < actions.length; j++) {
+        const action = actions[j];
+        if (sumActionDeposits) {
+          totalVolume += toYocto(action.deposit);
+        }
+        if (action.action === FUNCTION_CALL_ACTION) {
+          contractInteractions++;
+        }
+      }
+      
+      // Unique wallets - using signer and receiver
+      wallets.add(tx.signer_account_id);
+      wallets.add(tx.receiver_account_id);
+    }
+
+    this.totalVolume = totalVolume;
+    this.contractInteractions = contractInteractions;
+    this.transactionCount += transactions.length;
+  }
+
+  /**
+   * Returns the metrics for all transactions added so far
+   */
+  getMetrics(): OnchainMetrics {
+    this.wallets.delete(this.accountId);
+    this.wallets.delete("");
+    this.wallets.delete(null);
+    this.wallets.delete(undefined);
+
+    return {
+      transactionVolume: yoctoToNear(this.totalVolume), // Convert from yoctoNEAR to NEAR once, at the end
+      contractInteractions: this.contractInteractions,
+      uniqueWallets: this.wallets.size,
+      transactionCount: this.transactionCount,
+      metadata: {
+        collectionTimestamp: Date.now(),
+        source: 'nearblocks',
+        projectId: this.accountId
+      }
+    };
+  }
+}
 
+/**
+ * NEAR On-chain Calculator Class
+ */
+export class OnchainCalculator extends BaseCalculator {
   // Thresholds for maximum points (based on cohort 2 requirements)
   private readonly thresholds = {
     transactionVolume: 10000, // $10,000+ for max points
@@ -31,62 +138,28 @@ export class OnchainCalculator {
     total: 20                 // 20 points total for on-chain
   };
 
-  constructor(logger?: Logger) {
-    this.logger = logger;
-  }
-
-  /**
-   * Logs a message if logger is available
-   */
-  private log(message: string, data?: any): void {
-    if (this.logger) {
-      this.logger.info(message, data);
-    }
-  }
+  // Points per unit of each metric below its threshold (maxPoints / threshold), computed once
+  private readonly pointsPerUnit = {
+    transactionVolume: this.maxPoints.transactionVolume / this.thresholds.transactionVolume,
+    smartContractCalls: this.maxPoints.smartContractCalls / this.thresholds.smartContractCalls,
+    uniqueWallets: this.maxPoints.uniqueWallets / this.thresholds.uniqueWallets
+  };
 
   /**
    * Calculates on-chain metrics from raw transaction data
    * This function was moved from the collector to maintain separation of concerns
    */
   calculateOnchainMetricsFromTransactionData(transactionData: NearTransactionData): OnchainMetrics {
-    let totalVolume = 0;
-    let contractInteractions = 0;
-    const uniqueWallets = new Set<string>();
-    
-    for (const tx of transactionData.transactions) {
-      // Volume calculation - simplified with actions_agg
-      totalVolume += tx.actions_agg.deposit;
-      
-      // Contract interactions count
-      if (tx.actions) {
-        for (const action of tx.actions) {
-          if (action.action === "FUNCTION_CALL") {
-            contractInteractions++;
-          }
-        }
-      }
-      
-      // Unique wallets - using signer and receiver
-      const accountId = transactionData.metadata.account_id;
-      if (tx.signer_account_id && tx.signer_account_id !== accountId) {
-        uniqueWallets.add(tx.signer_account_id);
-      }
-      if (tx.receiver_account_id && tx.receiver_account_id !== accountId) {
-        uniqueWallets.add(tx.receiver_account_id);
-      }
-    }
+    const accumulator = new OnchainMetricsAccumulator(transactionData.metadata.account_id);
+    accumulator.addTransactions(transactionData.transactions);
+    return this.finalizeOnchainMetrics(accumulator);
+  }
 
-    const metrics: OnchainMetrics = {
-      transactionVolume: totalVolume / (10**24), // Convert from yoctoNEAR to NEAR
-      contractInteractions,
-      uniqueWallets: uniqueWallets.size,
-      transactionCount: transactionData.transactions.length,
-      metadata: {
-        collectionTimestamp: Date.now(),
-        source: 'nearblocks',
-        projectId: transactionData.metadata.account_id
-      }
-    };
+  /**
+   * Produces the on-chain metrics folded by an accumulator while transactions were collected
+   */
+  finalizeOnchainMetrics(accumulator: OnchainMetricsAccumulator): OnchainMetrics {
+    const metrics = accumulator.getMetrics();
 
     this.log("📊 On-chain metrics calculated:");
     this.log(`   - Transaction volume: ${metrics.transactionVolume} NEAR`);
@@ -103,9 +176,9 @@ export class OnchainCalculator {
    */
   private calculateTransactionVolumeScore(volumeNear: number, nearPriceUsd: number = 5): number {
     const volumeUsd = volumeNear * nearPriceUsd;
-    const score = Math.min(volumeUsd / this.thresholds.transactionVolume, 1) * this.maxPoints.transactionVolume;
+    const score = Math.min(volumeUsd * this.pointsPerUnit.transactionVolume, this.maxPoints.transactionVolume);
     
-    this.log(`📈 Transaction Volume Score:`, {
+    this.debug(`📈 Transaction Volume Score:`, {
       volumeNear,
       nearPriceUsd,
       volumeUsd,
@@ -120,9 +193,9 @@ export class OnchainCalculator {
    * Calculates smart contract calls score
    */
   private calculateSmartContractCallsScore(contractInteractions: number): number {
-    const score = Math.min(contractInteractions / this.thresholds.smartContractCalls, 1) * this.maxPoints.smartContractCalls;
+    const score = Math.min(contractInteractions * this.pointsPerUnit.smartContractCalls, this.maxPoints.smartContractCalls);
     
-    this.log(`🔗 Smart Contract Calls Score:`, {
+    this.debug(`🔗 Smart Contract Calls Score:`, {
       contractInteractions,
       threshold: this.thresholds.smartContractCalls,
       score: score.toFixed(2)
@@ -135,9 +208,9 @@ export class OnchainCalculator {
    * Calculates unique wallets score
    */
   private calculateUniqueWalletsScore(uniqueWallets: number): number {
-    const score = Math.min(uniqueWallets / this.thresholds.uniqueWallets, 1) * this.maxPoints.uniqueWallets;
+    const score = Math.min(uniqueWallets * this.pointsPerUnit.uniqueWallets, this.maxPoints.uniqueWallets);
     
-    this.log(`👥 Unique Wallets Score:`, {
+    this.debug(`👥 Unique Wallets Score:`, {
       uniqueWallets,
       threshold: this.thresholds.uniqueWallets,
       score: score.toFixed(2)
@@ -154,7 +227,7 @@ export class OnchainCalculator {
    * @returns Calculation result with scores and metadata
    */
   calculateOnchainScores(metrics: OnchainMetrics, nearPriceUsd: number = 5): OnchainCalculationResult {
-    this.log("🧮 Calculando pontuações on-chain");
+    this.log("🧮 Calculating on-chain scores");
     
     // Calculate individual scores
     const transactionVolumeScore = this.calculateTransactionVolumeScore(
@@ -179,7 +252,7 @@ export class OnchainCalculator {
       uniqueWallets: uniqueWalletsScore
     };
 
-    this.log("📊 Pontuações on-chain calculadas:", {
+    this.log("📊 On-chain scores calculated:", {
       transactionVolume: `${transactionVolumeScore.toFixed(2)}/${this.maxPoints.transactionVolume}`,
       smartContractCalls: `${smartContractCallsScore.toFixed(2)}/${this.maxPoints.smartContractCalls}`,
       uniqueWallets: `${uniqueWalletsScore.toFixed(2)}/${this.maxPoints.uniqueWallets}`,
@@ -202,15 +275,8 @@ export class OnchainCalculator {
    * Validates on-chain metrics data
    */
   validateMetrics(metrics: OnchainMetrics): boolean {
-    const requiredFields = [
-      'transactionVolume',
-      'contractInteractions', 
-      'uniqueWallets',
-      'transactionCount'
-    ];
-
-    for (const field of requiredFields) {
-      if (!(field in metrics) || typeof metrics[field as keyof OnchainMetrics] !== 'number') {
+    for (const field of REQUIRED_METRIC_FIELDS) {
+      if (!(field in metrics) || typeof metrics[field] !== 'number') {
         this.log(`❌ Validation failed: Missing or invalid field '${field}'`);
         return false;
       }
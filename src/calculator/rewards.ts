@@ -16,74 +16,77 @@ import {
   OffchainCalculationResult, 
   TotalRewardsResult 
 } from "../types";
-import { Logger } from "../utils/logger";
+import { BaseCalculator } from "./base";
 
 /**
- * Main Rewards Calculator Class
+ * Reward tiers based on total score (out of 100 points), ordered from the highest tier
  */
-export class RewardsCalculator {
-  private readonly logger?: Logger;
+export const REWARD_TIERS: readonly RewardTier[] = [
+  {
+    name: "Diamond",
+    emoji: "💎",
+    minScore: 85,
+    maxScore: 100,
+    reward: 10000,
+    color: "#B9F2FF"
+  },
+  {
+    name: "Gold", 
+    emoji: "🟡",
+    minScore: 70,
+    maxScore: 84,
+    reward: 6000,
+    color: "#FFD700"
+  },
+  {
+    name: "Silver",
+    emoji: "⚪",
+    minScore: 55,
+    maxScore: 69,
+    reward: 3000,
+    color: "#C0C0C0"
+  },
+  {
+    name: "Bronze",
+    emoji: "🟤",
+    minScore: 40,
+    maxScore: 54,
+    reward: 1000,
+    color: "#CD7F32"
+  },
+  {
+    name: "Contributor",
+    emoji: "⚫",
+    minScore: 20,
+    maxScore: 39,
+    reward: 500,
+    color: "#8B4513"
+  },
+  {
+    name: "Explorer",
+    emoji: "⚫",
+    minScore: 1,
+    maxScore: 19,
+    reward: 100,
+    color: "#A4A4A4"
+  },
+  {
+    name: "Member",
+    emoji: "⚫",
+    minScore: 0,
+    maxScore: 0,
+    reward: 0,
+    color: "#808080"
+  }
+];
 
-  // Reward tiers based on total score (out of 100 points)
-  private readonly rewardTiers: RewardTier[] = [
-    {
-      name: "Diamond",
-      emoji: "💎",
-      minScore: 85,
-      maxScore: 100,
-      reward: 10000,
-      color: "#B9F2FF"
-    },
-    {
-      name: "Gold", 
-      emoji: "🟡",
-      minScore: 70,
-      maxScore: 84,
-      reward: 6000,
-      color: "#FFD700"
-    },
-    {
-      name: "Silver",
-      emoji: "⚪",
-      minScore: 55,
-      maxScore: 69,
-      reward: 3000,
-      color: "#C0C0C0"
-    },
-    {
-      name: "Bronze",
-      emoji: "🟤",
-      minScore: 40,
-      maxScore: 54,
-      reward: 1000,
-      color: "#CD7F32"
-    },
-    {
-      name: "Contributor",
-      emoji: "⚫",
-      minScore: 20,
-      maxScore: 39,
-      reward: 500,
-      color: "#8B4513"
-    },
-    {
-      name: "Explorer",
-      emoji: "⚫",
-      minScore: 1,
-      maxScore: 19,
-      reward: 100,
-      color: "#A4A4A4"
-    },
-    {
-      name: "Member",
-      emoji: "⚫",
-      minScore: 0,
-      maxScore: 0,
-      reward: 0,
-      color: "#808080"
-    }
-  ];
+// Tiers checked from the highest minimum score, sorted once at module load
+const TIERS_BY_MIN_SCORE: readonly RewardTier[] = [...REWARD_TIERS].sort((a, b) => b.minScore - a.minScore);
 
+/**
+ * Main Rewards Calculator Class
+ */
+export class RewardsCalculator extends BaseCalculator {
   // Score weights
   private readonly weights = {
     onchain: 0.20,  // 20%
@@ -99,34 +102,35 @@ export class RewardsCalculator {
     total: 80           // 80 points total for off-chain
   };
 
-  constructor(logger?: Logger) {
-    this.logger = logger;
-  }
+  // Thresholds for maximum off-chain points
+  private readonly offchainThresholds = {
+    commits: 100,      // 100 meaningful commits
+    pullRequests: 25,  // 25 merged PRs
+    reviews: 30,       // 30 substantive reviews
+    issues: 30         // 30 closed issues
+  };
 
-  /**
-   * Logs a message if logger is available
-   */
-  private log(message: string, data?: any): void {
-    if (this.logger) {
-      this.logger.info(message, data);
-    }
-  }
+  // Points per unit of each off-chain metric below its threshold (maxPoints / threshold), computed once
+  private readonly offchainPointsPerUnit = {
+    commits: this.offchainMaxPoints.commits / this.offchainThresholds.commits,
+    pullRequests: this.offchainMaxPoints.pullRequests / this.offchainThresholds.pullRequests,
+    reviews: this.offchainMaxPoints.reviews / this.offchainThresholds.reviews,
+    issues: this.offchainMaxPoints.issues / this.offchainThresholds.issues
+  };
 
   /**
    * Determines reward tier based on total score
    */
   private determineTier(totalScore: number): RewardTier {
-    // Sort tiers by minScore descending to check highest tiers first
-    const sortedTiers = [...this.rewardTiers].sort((a, b) => b.minScore - a.minScore);
-    
-    for (const tier of sortedTiers) {
+    // Check highest tiers first
+    for (const tier of TIERS_BY_MIN_SCORE) {
       if (totalScore >= tier.minScore) {
         return tier;
       }
     }
     
     // Default to Member tier if no match found (score is 0)
-    return this.rewardTiers[this.rewardTiers.length - 1];
+    return REWARD_TIERS[REWARD_TIERS.length - 1];
   }
 
   /**
@@ -140,19 +144,11 @@ export class RewardsCalculator {
   ): OffchainCalculationResult {
     this.log("🧮 Calculating off-chain score (GitHub)");
 
-    // Thresholds for maximum points
-    const thresholds = {
-      commits: 100,      // 100 meaningful commits
-      pullRequests: 25,  // 25 merged PRs
-      reviews: 30,       // 30 substantive reviews
-      issues: 30         // 30 closed issues
-    };
-
     // Calculate individual scores
-    const commitsScore = Math.min(commits / thresholds.commits, 1) * this.offchainMaxPoints.commits;
-    const pullRequestsScore = Math.min(pullRequests / thresholds.pullRequests, 1) * this.offchainMaxPoints.pullRequests;
-    const reviewsScore = Math.min(reviews / thresholds.reviews, 1) * this.offchainMaxPoints.reviews;
-    const issuesScore = Math.min(issues / thresholds.issues, 1) * this.offchainMaxPoints.issues;
+    const commitsScore = Math.min(commits * this.offchainPointsPerUnit.commits, this.offchainMaxPoints.commits);
+    const pullRequestsScore = Math.min(pullRequests * this.offchainPointsPerUnit.pullRequests, this.offchainMaxPoints.pullRequests);
+    const reviewsScore = Math.min(reviews * this.offchainPointsPerUnit.reviews, this.offchainMaxPoints.reviews);
+    const issuesScore = Math.min(issues * this.offchainPointsPerUnit.issues, this.offchainMaxPoints.issues);
 
     const totalScore = commitsScore + pullRequestsScore + reviewsScore + issuesScore;
 
@@ -257,7 +253,7 @@ export class RewardsCalculator {
    * Gets all available reward tiers
    */
   getRewardTiers(): RewardTier[] {
-    return this.rewardTiers;
+    return [...REWARD_TIERS];
   }
 
   /**
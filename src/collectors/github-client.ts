@@ -0,0 +1,375 @@
+/**
+ * GitHub API client factory
+ *
+ * Builds the Octokit instance shared by all off-chain collectors so that
+ * every repository reuses the same client and its pooled connections.
+ */
+
+import { Octokit } from "@octokit/rest";
+import { EtagCache } from "../utils/etag-cache";
+import { LruCache } from "../utils/lru-cache";
+import { RateLimiter } from "../utils/rate-limiter";
+import { RateLimitState } from "../utils/rate-limit-state";
+import { mapWithConcurrency } from "../utils/concurrency";
+import { parseRetryAfter, sleep } from "../utils/http";
+import { BaseError, ErrorCode } from "../types/errors";
+
+// HTTP status returned by GitHub for conditional requests on unchanged resources
+const HTTP_NOT_MODIFIED = 304;
+
+// Statuses GitHub uses for primary and secondary rate limiting
+const HTTP_FORBIDDEN = 403;
+const HTTP_TOO_MANY_REQUESTS = 429;
+
+// Retries for rate-limited or transiently failing requests before the error is passed on
+const MAX_RATE_LIMIT_RETRIES = 3;
+const RATE_LIMIT_BACKOFF_MS = 1000; // Base delay for 429s without timing headers, doubled per attempt
+const MAX_RATE_LIMIT_WAIT_MS = 15 * 60 * 1000; // Longer waits fail fast instead of stalling the run
+
+// Transient gateway failures retried with exponential backoff
+const RETRYABLE_SERVER_STATUSES: readonly number[] = [502, 503, 504];
+const SERVER_ERROR_BACKOFF_MS = 500; // Base delay for server errors, doubled per attempt
+
+// Largest page size accepted by GitHub list endpoints
+const GITHUB_PAGE_SIZE = 100;
+
+// Rate limit resources GitHub reports in X-RateLimit-Resource
+const SEARCH_RESOURCE = "search";
+const GRAPHQL_RESOURCE = "graphql";
+const CORE_RESOURCE = "core";
+
+// Captures the URL of the rel="last" entry in a GitHub Link header
+const LINK_LAST_PATTERN = /<([^>]+)>;\s*rel="last"/;
+
+export interface GitHubClientOptions {
+  etagCache?: EtagCache;
+  rateLimiter?: RateLimiter;
+  searchRateLimiter?: RateLimiter; // Separate bucket for the much smaller Search API quota
+  rateLimitState?: RateLimitState;
+  responseCacheSize?: number;
+}
+
+/**
+ * Checks whether an Octokit request error is a 304 Not Modified answer
+ */
+function isNotModifiedError(error: unknown): boolean {
+  return (
+    !!error &&
+    typeof error === "object" &&
+    "status" in error &&
+    error.status === HTTP_NOT_MODIFIED
+  );
+}
+
+/**
+ * Returns how long to wait before retrying a rate-limited request, or null when
+ * the error is not a rate limit (or the wait would be unreasonably long)
+ * Uses Retry-After, then the X-RateLimit-Reset of an exhausted window, then exponential backoff for 429
+ */
+function getRateLimitRetryDelay(error: unknown, attempt: number, now: number = Date.now()): number | null {
+  const { status, response } = (error ?? {}) as {
+    status?: number;
+    response?: { headers?: Record<string, string | number | undefined> };
+  };
+  if (status !== HTTP_FORBIDDEN && status !== HTTP_TOO_MANY_REQUESTS) {
+    return null;
+  }
+
+  const headers = response?.headers ?? {};
+  let delayMs = parseRetryAfter(headers["retry-after"] === undefined ? null : String(headers["retry-after"]), now);
+
+  if (delayMs === null && Number(headers["x-ratelimit-remaining"]) === 0 && headers["x-ratelimit-reset"] !== undefined) {
+    delayMs = Math.max(0, Number(headers["x-ratelimit-reset"]) * 1000 - now);
+  }
+
+  if (delayMs === null && status === HTTP_TOO_MANY_REQUESTS) {
+    delayMs = RATE_LIMIT_BACKOFF_MS * 2 ** attempt;
+  }
+
+  // A 403 without rate limit headers is a permission error
+  return delayMs !== null && Number.isFinite(delayMs) && delayMs <= MAX_RATE_LIMIT_WAIT_MS ? delayMs : null;
+}
+
+/**
+ * Returns the backoff before retrying a transient server error, or null for any other error
+ */
+function getServerErrorRetryDelay(error: unknown, attempt: number): number | null {
+  const status = (error as { status?: number } | undefined)?.status;
+  return status !== undefined && RETRYABLE_SERVER_STATUSES.includes(status)
+    ? SERVER_ERROR_BACKOFF_MS * 2 ** attempt
+    : null;
+}
+
+/**
+ * Retries requests rejected by GitHub's primary or secondary rate limits after the advertised wait,
+ * and transient gateway errors (502/503/504) after an exponential backoff
+ */
+function installRateLimitRetry(octokit: Octokit): void {
+  octokit.hook.wrap("request", async (request, options) => {
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await request(options);
+      } catch (error) {
+        const delayMs = attempt < MAX_RATE_LIMIT_RETRIES
+          ? getRateLimitRetryDelay(error, attempt) ?? getServerErrorRetryDelay(error, attempt)
+          : null;
+        if (delayMs === null) {
+          throw error;
+        }
+        await sleep(delayMs);
+      }
+    }
+  });
+}
+
+/**
+ * Returns the rate limit resource a request counts against, based on its route
+ */
+function getRateLimitResource(url: string | undefined): string {
+  const path = (url ?? "").replace(/^https:\/\/api\.github\.com/, "");
+  if (path.startsWith("/search/")) {
+    return SEARCH_RESOURCE;
+  }
+  if (path.startsWith("/graphql")) {
+    return GRAPHQL_RESOURCE;
+  }
+  return CORE_RESOURCE;
+}
+
+/**
+ * Keeps the rate limit state in sync with the X-RateLimit-* headers of every
+ * response, including error responses such as 304 Not Modified and 403
+ */
+function installRateLimitTracking(octokit: Octokit, rateLimitState: RateLimitState): void {
+  octokit.hook.wrap("request", async (request, options) => {
+    try {
+      const response = await request(options);
+      rateLimitState.updateFromHeaders(response.headers);
+      return response;
+    } catch (error) {
+      const headers = (error as { response?: { headers?: Record<string, string | number | undefined> } })?.response?.headers;
+      if (headers) {
+        rateLimitState.updateFromHeaders(headers);
+      }
+      throw error;
+    }
+  });
+}
+
+/**
+ * Installs conditional-request handling: serves bodies confirmed within the cache's
+ * max age directly, sends If-None-Match for other known URLs and serves the cached
+ * body when GitHub answers 304 Not Modified
+ */
+function installEtagCache(octokit: Octokit, etagCache: EtagCache): void {
+  octokit.hook.wrap("request", async (request, options) => {
+    if (options.method !== "GET") {
+      return request(options);
+    }
+
+    const { url } = octokit.request.endpoint(options);
+
+    // Recently confirmed bodies are served without a request at all
+    const fresh = etagCache.getFresh(url);
+    if (fresh) {
+      etagCache.markHit(url, false);
+      return {
+        status: fresh.status,
+        url: fresh.url,
+        headers: fresh.headers,
+        data: fresh.data,
+      };
+    }
+
+    const cached = etagCache.get(url);
+    if (cached) {
+      options.headers = { ...options.headers, "if-none-match": cached.etag };
+    }
+
+    try {
+      const response = await request(options);
+      const etag = response.headers.etag;
+      if (etag) {
+        const headers: Record<string, string> = { etag };
+        if (response.headers.link) {
+          headers.link = response.headers.link;
+        }
+        etagCache.set(url, {
+          etag,
+          status: response.status,
+          url: response.url,
+          headers,
+          data: response.data,
+        });
+      }
+      return response;
+    } catch (error) {
+      if (cached && isNotModifiedError(error)) {
+        etagCache.markHit(url);
+        return {
+          status: cached.status,
+          url: cached.url,
+          headers: cached.headers,
+          data: cached.data,
+        };
+      }
+      throw error;
+    }
+  });
+}
+
+/**
+ * Keeps only the parts of a response that callers read (status, URL, body and the
+ * link/etag headers), so cached entries do not hold full Octokit response objects
+ */
+function toCachedResponse(response: { status: number; url: string; headers: Record<string, unknown>; data: unknown }) {
+  const headers: Record<string, string> = {};
+  if (typeof response.headers.link === "string") {
+    headers.link = response.headers.link;
+  }
+  if (typeof response.headers.etag === "string") {
+    headers.etag = response.headers.etag;
+  }
+  return { status: response.status, url: response.url, headers, data: response.data };
+}
+
+/**
+ * Installs an in-process response cache keyed by request URL, so identical GET
+ * requests made during one run (e.g. a repository shared by several projects)
+ * are answered from memory without touching the network or the rate budget.
+ * Identical requests issued while the first is still pending share its result.
+ * Entries never expire, so the cache is meant to live for a single run only.
+ */
+function installResponseCache(octokit: Octokit, maxSize: number): void {
+  const cache = new LruCache<string, any>(maxSize); // Trimmed response objects
+  const inFlight = new Map<string, Promise<any>>();
+
+  octokit.hook.wrap("request", async (request, options) => {
+    if (options.method !== "GET") {
+      return request(options);
+    }
+
+    const { url } = octokit.request.endpoint(options);
+    const cached = cache.get(url);
+    if (cached) {
+      return cached;
+    }
+
+    const pending = inFlight.get(url);
+    if (pending) {
+      return pending;
+    }
+
+    const promise = request(options).then(toCachedResponse);
+    inFlight.set(url, promise);
+    try {
+      const response = await promise;
+      cache.set(url, response);
+      return response;
+    } finally {
+      inFlight.delete(url);
+    }
+  });
+}
+
+/**
+ * Returns the last page number advertised by a GitHub Link header, or 1 when there is none
+ */
+export function getLastPage(link: string | undefined): number {
+  const match = link ? LINK_LAST_PATTERN.exec(link) : null;
+  if (!match) {
+    return 1;
+  }
+
+  const page = Number(new URL(match[1]).searchParams.get("page"));
+  return Number.isInteger(page) && page > 1 ? page : 1;
+}
+
+/**
+ * Fetches every page of a page-numbered GitHub list endpoint
+ * The first page reveals the page count through its Link header (rel="last"),
+ * then the remaining pages are requested concurrently and joined in order
+ *
+ * @param octokit GitHub client
+ * @param route Request route, e.g. "GET /repos/{owner}/{repo}/commits"
+ * @param params Route and query parameters (per_page and page are set here)
+ * @param concurrency Maximum number of page requests in flight
+ */
+export async function paginateByPageNumber<T>(
+  octokit: Octokit,
+  route: string,
+  params: Record<string, unknown>,
+  concurrency: number
+): Promise<T[]> {
+  const firstPage = await octokit.request(route, { ...params, per_page: GITHUB_PAGE_SIZE, page: 1 });
+  const lastPage = getLastPage(firstPage.headers.link);
+
+  const remainingPages = Array.from({ length: lastPage - 1 }, (_, index) => index + 2);
+  const pages = await mapWithConcurrency(remainingPages, concurrency, async (page) => {
+    const response = await octokit.request(route, { ...params, per_page: GITHUB_PAGE_SIZE, page });
+    return response.data as T[];
+  });
+
+  return [firstPage.data as T[], ...pages].flat();
+}
+
+/**
+ * Creates a GitHub API client authenticated with the given token
+ *
+ * @param token GitHub API token
+ * @param options Optional client features (conditional request cache, per-request rate limiting
+ *                with a separate search bucket, rate limit header tracking and throttling, in-process response cache)
+ *                Requests rejected by GitHub rate limits or transient gateway errors are always retried
+ */
+export function createGitHubClient(token: string, options: GitHubClientOptions = {}): Octokit {
+  const octokit = new Octokit({ auth: token });
+
+  const { rateLimiter } = options;
+  if (rateLimiter) {
+    // Acquire one token per HTTP request, including every page of a paginated call
+    octokit.hook.before("request", () => rateLimiter.acquire());
+  }
+
+  const { searchRateLimiter } = options;
+  if (searchRateLimiter) {
+    // Search requests also take a token from their own bucket, sized for the search quota
+    octokit.hook.before("request", async (options) => {
+      if (getRateLimitResource(options.url) === SEARCH_RESOURCE) {
+        await searchRateLimiter.acquire();
+      }
+    });
+  }
+
+  const { rateLimitState } = options;
+  if (rateLimitState) {
+    // Pause a request while its own resource's budget is nearly exhausted, until that window resets;
+    // like retries, waits beyond the cap fail fast instead of stalling every request in flight
+    octokit.hook.before("request", async (options) => {
+      const resource = getRateLimitResource(options.url);
+      const waitMs = rateLimitState.getWaitTime(resource);
+      if (waitMs > MAX_RATE_LIMIT_WAIT_MS) {
+        throw new BaseError(
+          `GitHub ${resource} rate limit is exhausted for another ${Math.ceil(waitMs / 60000)} minutes`,
+          ErrorCode.RATE_LIMITED,
+          { resource, waitMs }
+        );
+      }
+      await rateLimitState.waitIfNeeded(resource);
+    });
+    installRateLimitTracking(octokit, rateLimitState);
+  }
+
+  // Wraps the hooks above so each retry is rate limited and tracked again
+  installRateLimitRetry(octokit);
+
+  if (options.etagCache) {
+    installEtagCache(octokit, options.etagCache);
+  }
+
+  // Installed last so it wraps the hooks above: cache hits skip rate limiting and conditional requests
+  if (options.responseCacheSize) {
+    installResponseCache(octokit, options.responseCacheSize);
+  }
+
+  return octokit;
+}
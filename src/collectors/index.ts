@@ -4,4 +4,5 @@
 
 export * from './base';
 export * from './offchain';
-export * from './onchain'; 
\ No newline at end of file
+export * from './onchain';
+export * from './github-client'; 
\ No newline at end of file
@@ -14,48 +14,132 @@ import { Octokit } from "@octokit/rest";
 import { BaseCollector } from "./base";
 import { Logger } from "../utils/logger";
 import { RateLimiter } from "../utils/rate-limiter";
-import { getDateRangeForMonthIso } from "../utils/date-utils";
-import { GitHubMetrics } from "../types/metrics";
+import { getDateRangeForMonthIso, getMonthBounds } from "../utils/date-utils";
+import { mapWithConcurrency } from "../utils/concurrency";
+import { createGitHubClient, paginateByPageNumber } from "./github-client";
+import { GitHubMetrics, GitHubReviewSource } from "../types/metrics";
 import { BaseError, ErrorCode } from "../types/errors";
-import { GitHubPullRequest, GitHubIssue, GitHubCommit, GitHubReview } from "../types/github";
+import {
+  GitHubIssue,
+  GitHubCommit,
+  GitHubReview,
+  GitHubReviewComment,
+  GitHubGraphQLPullRequest,
+  GitHubPullRequestsQueryResult,
+} from "../types/github";
+
+// Maximum number of per-PR review requests in flight at once
+const MAX_CONCURRENT_REVIEW_REQUESTS = 8;
+
+// Maximum number of list pages fetched in parallel once the page count is known
+const MAX_CONCURRENT_PAGE_REQUESTS = 8;
+
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
+// Matches a full repository name ("owner/repo") and captures both parts
+const REPOSITORY_PATTERN = /^([^/\s]+)\/([^/\s]+)$/;
+
+// Fractional seconds of an ISO timestamp, which search qualifiers do not accept
+const ISO_MILLISECONDS_PATTERN = /\.\d+Z$/;
+
+// The Search API returns at most this many results for a query
+const SEARCH_RESULT_LIMIT = 1000;
+const SEARCH_PAGE_SIZE = 100;
+const MAX_CONCURRENT_SEARCH_PAGE_REQUESTS = 2; // Search has its own, much smaller quota
+
+// PRs ordered by last update with the fields used by the PR metrics, each with its first page of reviews
+const PULL_REQUESTS_WITH_REVIEWS_QUERY = `
+  query ($owner: String!, $name: String!, $cursor: String) {
+    repository(owner: $owner, name: $name) {
+      pullRequests(first: 100, after: $cursor, orderBy: { field: UPDATED_AT, direction: DESC }) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          number
+          createdAt
+          updatedAt
+          state
+          mergedAt
+          author {
+            login
+          }
+          reviews(first: 100) {
+            pageInfo {
+              hasNextPage
+            }
+            nodes {
+              author {
+                login
+              }
+              submittedAt
+            }
+          }
+        }
+      }
+    }
+  }
+`;
+
+/**
+ * Returns the type of the first error in a GraphQL error response, if any
+ */
+function getGraphQLErrorType(error: unknown): string | undefined {
+  if (error && typeof error === 'object' && 'errors' in error && Array.isArray(error.errors)) {
+    const [first] = error.errors as Array<{ type?: string }>;
+    return first?.type;
+  }
+  return undefined;
+}
 
 export class OffchainCollector extends BaseCollector {
   private readonly octokit: Octokit;
   private readonly owner: string;
   private readonly repo: string;
+  private readonly reviewSource: GitHubReviewSource;
+  // PR scans shared by the pull request and review metrics, keyed by period start
+  private readonly pullRequestScans = new Map<number, Promise<GitHubGraphQLPullRequest[]>>();
 
   /**
    * Creates a new GitHub collector
    * 
    * @param token GitHub API token
    * @param repo Repository in format "owner/repo"
+   * @param octokit Optional shared GitHub client (created from the token if omitted)
+   * @param reviewSource What counts as a review: submitted PR reviews (default) or PR review comments
    * @param logger Optional logger
    * @param rateLimiter Optional rate limiter
    */
   constructor({
     token,
     repo,
+    octokit,
+    reviewSource = "reviews",
     logger,
     rateLimiter,
   }: {
     token: string;
     repo: string;
+    octokit?: Octokit;
+    reviewSource?: GitHubReviewSource;
     logger?: Logger;
     rateLimiter?: RateLimiter;
   }) {
     super(logger, rateLimiter);
 
-    const [owner, repoName] = repo.split("/");
-    if (!owner || !repoName) {
+    const match = REPOSITORY_PATTERN.exec(repo);
+    if (!match) {
       throw new BaseError(
         "Invalid repository format. Expected 'owner/repo'",
         ErrorCode.BAD_REQUEST
       );
     }
 
-    this.owner = owner;
-    this.repo = repoName;
-    this.octokit = new Octokit({ auth: token });
+    this.owner = match[1];
+    this.repo = match[2];
+    this.octokit = octokit ?? createGitHubClient(token);
+    this.reviewSource = reviewSource;
   }
 
   /**
@@ -91,19 +175,20 @@ export class OffchainCollector extends BaseCollector {
     
     this.log(`Collecting commits from ${since} to ${until}`);
     
-    const commits = await this.withRateLimit(async () => {
-      const response = await this.octokit.paginate(
-        this.octokit.rest.repos.listCommits,
+    // Pages are requested in parallel once the first response reveals the page count
+    const commits = await this.withRateLimit(() =>
+      paginateByPageNumber<GitHubCommit>(
+        this.octokit,
+        "GET /repos/{owner}/{repo}/commits",
         {
           owner: this.owner,
           repo: this.repo,
           since,
           until,
-          per_page: 100,
-        }
-      );
-      return response as GitHubCommit[];
-    });
+        },
+        MAX_CONCURRENT_PAGE_REQUESTS
+      )
+    );
 
     // Count authors and their contributions
     const authors = new Map<string, number>();
@@ -111,6 +196,9 @@ export class OffchainCollector extends BaseCollector {
     let weekly = 0;
     let monthly = 0;
 
+    // Recency windows are measured from a single reference time for the whole batch
+    const now = Date.now();
+
     for (const commit of commits) {
       const login = commit.author?.login || 
         (commit.commit.author ? `${commit.commit.author.name} <${commit.commit.author.email}>` : "unknown");
@@ -122,10 +210,7 @@ export class OffchainCollector extends BaseCollector {
         const dayIndex = date.getDay();
         daily[dayIndex]++;
 
-        const now = new Date();
-        const daysDiff = Math.floor(
-          (now.getTime() - date.getTime()) / (1000 * 60 * 60 * 24)
-        );
+        const daysDiff = Math.floor((now - date.getTime()) / MS_PER_DAY);
 
         if (daysDiff <= 7) {
           weekly++;
@@ -145,7 +230,7 @@ export class OffchainCollector extends BaseCollector {
         weekly,
         monthly,
       },
-      authors: Array.from(authors.entries()).map(([login, count]) => ({
+      authors: Array.from(authors, ([login, count]) => ({
         login,
         count,
       })),
@@ -156,51 +241,42 @@ export class OffchainCollector extends BaseCollector {
    * Collects pull request metrics for the repository
    */
   async collectPullRequestMetrics(year: number, month: number): Promise<GitHubMetrics["pullRequests"]> {
-    const { since, until } = getDateRangeForMonthIso(year, month);
+    const { since, until, sinceTime, untilTime } = getMonthBounds(year, month);
     
     this.log(`Collecting pull requests from ${since} to ${until}`);
-    
-    const allPRs = await this.withRateLimit(async () => {
-      const response = await this.octokit.paginate(
-        this.octokit.rest.pulls.list,
-        {
-          owner: this.owner,
-          repo: this.repo,
-          state: "all",
-          sort: "created",
-          direction: "desc",
-          per_page: 100,
-        }
-      );
-      return response as GitHubPullRequest[];
-    });
 
-    // Filter PRs created in the specified time period
-    const prs = allPRs.filter(pr => {
-      const createdAt = new Date(pr.created_at);
-      return createdAt >= new Date(since) && createdAt <= new Date(until);
-    });
+    // Same GraphQL scan as the review metrics: PRs created in the period were also updated in it
+    const pullRequests = await this.getPullRequestsWithReviews(sinceTime);
 
     const authors = new Set<string>();
+    let count = 0;
     let open = 0;
     let merged = 0;
     let closed = 0;
 
-    for (const pr of prs) {
-      if (pr.user?.login) {
-        authors.add(pr.user.login);
+    // Single pass: filter PRs created in the specified time period and tally them
+    for (const pr of pullRequests) {
+      const createdTime = Date.parse(pr.createdAt);
+      if (createdTime < sinceTime || createdTime > untilTime) {
+        continue;
       }
+      count++;
 
-      if (pr.state === "open") {
+      const login = pr.author?.login;
+      if (login) {
+        authors.add(login);
+      }
+
+      if (pr.state === "OPEN") {
         open++;
-      } else if (pr.merged_at) {
+      } else if (pr.mergedAt) {
         merged++;
       } else {
         closed++;
       }
     }
 
-    this.log(`Collected ${prs.length} pull requests`);
+    this.log(`Collected ${count} pull requests`);
 
     return {
       open,
@@ -211,102 +287,277 @@ export class OffchainCollector extends BaseCollector {
   }
 
   /**
-   * Collects review metrics for the repository
+   * Returns the PRs updated since the given time, running the GraphQL scan once
+   * per period so pull request and review metrics share the same requests
    */
-  async collectReviewMetrics(year: number, month: number): Promise<GitHubMetrics["reviews"]> {
-    const { since, until } = getDateRangeForMonthIso(year, month);
-    
-    this.log(`Collecting reviews from ${since} to ${until}`);
-    
-    // First get all PRs that might have reviews in the time period
-    const allPRs = await this.withRateLimit(async () => {
+  private getPullRequestsWithReviews(sinceTime: number): Promise<GitHubGraphQLPullRequest[]> {
+    let scan = this.pullRequestScans.get(sinceTime);
+    if (!scan) {
+      scan = this.fetchPullRequestsWithReviews(sinceTime);
+      this.pullRequestScans.set(sinceTime, scan);
+    }
+    return scan;
+  }
+
+  /**
+   * Fetches PRs updated since the given time together with their first reviews.
+   * Uses GraphQL so a single request returns up to 100 PRs and their reviews.
+   */
+  private async fetchPullRequestsWithReviews(sinceTime: number): Promise<GitHubGraphQLPullRequest[]> {
+    const pullRequests: GitHubGraphQLPullRequest[] = [];
+    let cursor: string | null = null;
+
+    while (true) {
+      const result: GitHubPullRequestsQueryResult = await this.withRateLimit(() =>
+        this.octokit.graphql<GitHubPullRequestsQueryResult>(PULL_REQUESTS_WITH_REVIEWS_QUERY, {
+          owner: this.owner,
+          name: this.repo,
+          cursor,
+        })
+      );
+
+      const { nodes, pageInfo } = result.repository.pullRequests;
+      let reachedOlderPullRequests = false;
+
+      // PRs come most recently updated first; submitting a review updates the PR,
+      // so the first PR last updated before the period ends the scan
+      for (const pr of nodes) {
+        if (Date.parse(pr.updatedAt) < sinceTime) {
+          reachedOlderPullRequests = true;
+          break;
+        }
+        pullRequests.push(pr);
+      }
+
+      if (reachedOlderPullRequests || !pageInfo.hasNextPage) {
+        break;
+      }
+      cursor = pageInfo.endCursor;
+    }
+
+    return pullRequests;
+  }
+
+  /**
+   * Fetches every review of a single PR through the REST API
+   */
+  private async fetchPullRequestReviews(pullNumber: number): Promise<GitHubReview[]> {
+    return this.withRateLimit(async () => {
       const response = await this.octokit.paginate(
-        this.octokit.rest.pulls.list,
+        this.octokit.rest.pulls.listReviews,
         {
           owner: this.owner,
           repo: this.repo,
-          state: "all",
-          sort: "updated",
-          direction: "desc",
+          pull_number: pullNumber,
           per_page: 100,
         }
       );
-      return response as GitHubPullRequest[];
+      return response as GitHubReview[];
     });
+  }
+
+  /**
+   * Counts submitted PR reviews and their authors within the time range
+   */
+  private async countSubmittedReviews(sinceTime: number, untilTime: number): Promise<GitHubMetrics["reviews"]> {
+    const pullRequests = await this.getPullRequestsWithReviews(sinceTime);
+
+    // The few PRs with more reviews than a GraphQL page holds are completed via REST,
+    // fetched concurrently and bounded to respect GitHub secondary rate limits
+    const truncatedPRs = pullRequests.filter(pr => pr.reviews.pageInfo.hasNextPage);
+    const restReviewsByPR = await mapWithConcurrency(truncatedPRs, MAX_CONCURRENT_REVIEW_REQUESTS, (pr) =>
+      this.fetchPullRequestReviews(pr.number)
+    );
 
     const authors = new Set<string>();
     let count = 0;
 
-    // For each PR, get its reviews
-    for (const pr of allPRs) {
-      const reviews = await this.withRateLimit(async () => {
-        const response = await this.octokit.paginate(
-          this.octokit.rest.pulls.listReviews,
-          {
-            owner: this.owner,
-            repo: this.repo,
-            pull_number: pr.number,
-            per_page: 100,
-          }
-        );
-        return response as GitHubReview[];
-      });
-
-      // Filter reviews submitted in the specified time period
-      const periodReviews = reviews.filter(review => {
-        const submittedAt = new Date(review.submitted_at);
-        return submittedAt >= new Date(since) && submittedAt <= new Date(until);
-      });
+    // Count reviews submitted in the specified time period
+    const addReview = (login: string | undefined, submittedAt: string | null): void => {
+      if (!submittedAt) {
+        return; // Pending reviews have not been submitted yet
+      }
+      const submittedTime = Date.parse(submittedAt);
+      if (submittedTime < sinceTime || submittedTime > untilTime) {
+        return;
+      }
+      count++;
+      if (login) {
+        authors.add(login);
+      }
+    };
 
-      count += periodReviews.length;
+    for (const pr of pullRequests) {
+      if (pr.reviews.pageInfo.hasNextPage) {
+        continue;
+      }
+      for (const review of pr.reviews.nodes) {
+        addReview(review.author?.login, review.submittedAt);
+      }
+    }
 
-      for (const review of periodReviews) {
-        if (review.user?.login) {
-          authors.add(review.user.login);
-        }
+    for (const reviews of restReviewsByPR) {
+      for (const review of reviews) {
+        addReview(review.user?.login, review.submitted_at);
       }
     }
 
-    this.log(`Collected ${count} reviews`);
+    return {
+      count,
+      authors: Array.from(authors),
+      source: "reviews",
+    };
+  }
+
+  /**
+   * Counts PR review comments and their authors within the time range
+   * Uses the repository-wide review comments listing, so no per-PR requests are needed
+   */
+  private async countReviewComments(since: string, sinceTime: number, untilTime: number): Promise<GitHubMetrics["reviews"]> {
+    const authors = new Set<string>();
+    let count = 0;
+
+    await this.withRateLimit(() =>
+      this.octokit.paginate(
+        "GET /repos/{owner}/{repo}/pulls/comments",
+        {
+          owner: this.owner,
+          repo: this.repo,
+          since, // Filters on last update; creation time is checked below
+          sort: "created",
+          direction: "asc",
+          per_page: 100,
+        },
+        (response, done) => {
+          for (const comment of response.data as GitHubReviewComment[]) {
+            const createdTime = Date.parse(comment.created_at);
+            if (createdTime > untilTime) {
+              // Comments come oldest first, the rest were created after the period
+              done();
+              break;
+            }
+            if (createdTime >= sinceTime) {
+              count++;
+              if (comment.user?.login) {
+                authors.add(comment.user.login);
+              }
+            }
+          }
+          return [];
+        }
+      )
+    );
 
     return {
       count,
       authors: Array.from(authors),
+      source: "review_comments",
     };
   }
 
   /**
-   * Collects issue metrics for the repository
+   * Collects review metrics for the repository
    */
-  async collectIssueMetrics(year: number, month: number): Promise<GitHubMetrics["issues"]> {
-    const { since, until } = getDateRangeForMonthIso(year, month);
-    
-    this.log(`Collecting issues from ${since} to ${until}`);
+  async collectReviewMetrics(year: number, month: number): Promise<GitHubMetrics["reviews"]> {
+    const { since, until, sinceTime, untilTime } = getMonthBounds(year, month);
     
-    const allIssues = await this.withRateLimit(async () => {
-      const response = await this.octokit.paginate(
-        this.octokit.rest.issues.listForRepo,
+    this.log(`Collecting reviews from ${since} to ${until} (source: ${this.reviewSource})`);
+
+    const reviews = this.reviewSource === "review_comments"
+      ? await this.countReviewComments(since, sinceTime, untilTime)
+      : await this.countSubmittedReviews(sinceTime, untilTime);
+
+    this.log(`Collected ${reviews.count} reviews`);
+
+    return reviews;
+  }
+
+  /**
+   * Fetches issues (excluding PRs) updated since the given time
+   * The Search API filters PRs out server-side; when the result set exceeds what
+   * search can return, or search reports incomplete results, the full repository
+   * issue listing is used instead
+   */
+  private async fetchIssuesUpdatedSince(since: string): Promise<GitHubIssue[]> {
+    // A fixed sort keeps page boundaries stable across the separate page requests
+    const searchParams = {
+      // Full timestamp, since the local month start is usually on the previous UTC day
+      q: `repo:${this.owner}/${this.repo} is:issue updated:>=${since.replace(ISO_MILLISECONDS_PATTERN, "Z")}`,
+      sort: "updated" as const,
+      order: "desc" as const,
+      per_page: SEARCH_PAGE_SIZE,
+    };
+
+    const firstPage = await this.withRateLimit(() =>
+      this.octokit.request("GET /search/issues", searchParams)
+    );
+
+    if (firstPage.data.total_count > SEARCH_RESULT_LIMIT) {
+      this.log(`Issue search matched ${firstPage.data.total_count} results, falling back to the issues listing`);
+      return this.listIssuesUpdatedSince(since);
+    }
+
+    // The total count gives the page count up front, so the remaining pages are fetched a couple at a time
+    const pageCount = Math.ceil(firstPage.data.total_count / SEARCH_PAGE_SIZE);
+    const remainingPageNumbers = Array.from({ length: Math.max(0, pageCount - 1) }, (_, index) => index + 2);
+    const remainingPages = await mapWithConcurrency(remainingPageNumbers, MAX_CONCURRENT_SEARCH_PAGE_REQUESTS, (page) =>
+      this.withRateLimit(async () => {
+        const response = await this.octokit.request("GET /search/issues", { ...searchParams, page });
+        return response.data;
+      })
+    );
+
+    // A search that timed out returns partial results; the listing is slower but complete
+    const pages = [firstPage.data, ...remainingPages];
+    if (pages.some(page => page.incomplete_results)) {
+      this.log("Issue search returned incomplete results, falling back to the issues listing");
+      return this.listIssuesUpdatedSince(since);
+    }
+
+    return pages.flatMap(page => page.items as GitHubIssue[]);
+  }
+
+  /**
+   * Lists issues updated since the given time through the repository issues endpoint
+   * Pages are requested in parallel once the first response reveals the page count
+   */
+  private async listIssuesUpdatedSince(since: string): Promise<GitHubIssue[]> {
+    const issues = await this.withRateLimit(() =>
+      paginateByPageNumber<GitHubIssue>(
+        this.octokit,
+        "GET /repos/{owner}/{repo}/issues",
         {
           owner: this.owner,
           repo: this.repo,
           state: "all",
           since,
-          per_page: 100,
-        }
-      );
-      return response as GitHubIssue[];
-    });
+        },
+        MAX_CONCURRENT_PAGE_REQUESTS
+      )
+    );
 
-    // Filter out pull requests (GitHub's API returns PRs as issues)
-    const issues = allIssues.filter(issue => !issue.pull_request);
+    // GitHub's API returns PRs as issues
+    return issues.filter(issue => !issue.pull_request);
+  }
+
+  /**
+   * Collects issue metrics for the repository
+   */
+  async collectIssueMetrics(year: number, month: number): Promise<GitHubMetrics["issues"]> {
+    const { since, until } = getDateRangeForMonthIso(year, month);
+    
+    this.log(`Collecting issues from ${since} to ${until}`);
+    
+    const issues = await this.fetchIssuesUpdatedSince(since);
 
     const participants = new Set<string>();
     let open = 0;
     let closed = 0;
 
     for (const issue of issues) {
-      if (issue.user?.login) {
-        participants.add(issue.user.login);
+      const login = issue.user?.login;
+      if (login) {
+        participants.add(login);
       }
 
       if (issue.state === "open") {
@@ -355,7 +606,20 @@ export class OffchainCollector extends BaseCollector {
       
       return metrics;
     } catch (error: unknown) {
-      if (
+      const graphqlErrorType = getGraphQLErrorType(error);
+      if (graphqlErrorType === 'RATE_LIMITED') {
+        throw new BaseError(
+          'GitHub API rate limit exceeded. Please wait or use a different token.',
+          ErrorCode.RATE_LIMITED,
+          { originalError: error }
+        );
+      } else if (graphqlErrorType === 'NOT_FOUND') {
+        throw new BaseError(
+          `Repository ${this.owner}/${this.repo} not found or you don't have access to it.`,
+          ErrorCode.NOT_FOUND,
+          { originalError: error }
+        );
+      } else if (
         error && 
         typeof error === 'object' && 
         'status' in error &&
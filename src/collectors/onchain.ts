@@ -13,21 +13,80 @@
 import { BaseCollector } from "./base";
 import { Logger } from "../utils/logger";
 import { RateLimiter } from "../utils/rate-limiter";
-import { getDateRangeForMonth } from "../utils/date-utils";
+import { getMonthBounds } from "../utils/date-utils";
+import { fetchWithRetry } from "../utils/http";
+import { JsonStore } from "../utils/json-store";
 import { NearTransactionData, NearTransaction } from "../types/metrics";
 import { BaseError, ErrorCode } from "../types/errors";
 
+// Transactions requested per NearBlocks page
+const TRANSACTIONS_PAGE_SIZE = 100;
+
+// Store prefix for the per-account monthly transaction cache
+const TRANSACTIONS_CACHE_PREFIX = "cache/nearblocks";
+
+interface TransactionPage {
+  transactions: NearTransaction[];
+  cursor: string | null;
+}
+
+interface CachedTransactionMonth {
+  complete: boolean; // The month had already ended when it was fetched, so it can no longer change
+  transactions: NearTransaction[]; // Trimmed in-period transactions, newest first
+}
+
 interface OnchainCollectorConfig {
   apiKey: string;
   accountId: string;
   logger?: Logger;
   rateLimiter?: RateLimiter;
+  onTransactions?: (transactions: NearTransaction[]) => void; // Receives each page's in-period transactions
+  cacheStore?: JsonStore; // Keeps fetched months so later runs only request newer transactions
+}
+
+/**
+ * Converts a transaction's nanosecond block timestamp to epoch milliseconds
+ */
+function getTimestampMs(tx: NearTransaction): number {
+  return parseInt(tx.block_timestamp) / 1e6;
+}
+
+/**
+ * Copies the fields of a NearBlocks transaction that metrics and reports rely on,
+ * dropping everything else the API returns (receipts, large call arguments, ...)
+ */
+function trimTransaction(tx: NearTransaction): NearTransaction {
+  return {
+    id: tx.id,
+    transaction_hash: tx.transaction_hash,
+    signer_account_id: tx.signer_account_id,
+    receiver_account_id: tx.receiver_account_id,
+    block_timestamp: tx.block_timestamp,
+    actions: (tx.actions || []).map(action => ({
+      action: action.action,
+      method: action.method,
+      deposit: action.deposit,
+      fee: action.fee,
+      args: null
+    })),
+    actions_agg: {
+      deposit: tx.actions_agg?.deposit // Kept null/missing so the calculator sums the action deposits instead
+    },
+    outcomes: tx.outcomes && { status: tx.outcomes.status },
+    outcomes_agg: tx.outcomes_agg && { transaction_fee: tx.outcomes_agg.transaction_fee },
+    block: {
+      block_height: tx.block?.block_height
+    }
+  };
 }
 
 export class OnchainCollector extends BaseCollector {
   private readonly apiKey: string;
   private readonly accountId: string;
   private readonly baseUrl = "https://api.nearblocks.io/v1";
+  private readonly headers: Record<string, string>;
+  private readonly onTransactions?: (transactions: NearTransaction[]) => void;
+  private readonly cacheStore?: JsonStore;
 
   /**
    * Creates a new NEAR on-chain collector
@@ -39,6 +98,12 @@ export class OnchainCollector extends BaseCollector {
     
     this.apiKey = config.apiKey;
     this.accountId = config.accountId;
+    this.onTransactions = config.onTransactions;
+    this.cacheStore = config.cacheStore;
+    this.headers = {
+      "Authorization": `Bearer ${this.apiKey}`,
+      "Accept": "application/json"
+    };
   }
 
   /**
@@ -49,11 +114,8 @@ export class OnchainCollector extends BaseCollector {
       this.log("Testing NearBlocks API connection");
       
       await this.withRateLimit(async () => {
-        const response = await fetch(`${this.baseUrl}/account/${this.accountId}`, {
-          headers: {
-            "Authorization": `Bearer ${this.apiKey}`,
-            "Accept": "application/json"
-          }
+        const response = await fetchWithRetry(`${this.baseUrl}/account/${this.accountId}`, {
+          headers: this.headers
         });
 
         if (response.status === 404) {
@@ -78,127 +140,211 @@ export class OnchainCollector extends BaseCollector {
     }
   }
 
+  /**
+   * Fetches one page of the account's transactions, newest first
+   * Returns null when the account does not exist
+   */
+  private async fetchTransactionPage(cursor: string | null): Promise<TransactionPage | null> {
+    return this.withRateLimit(async () => {
+      // Build URL with cursor-based pagination
+      let url = `${this.baseUrl}/account/${this.accountId}/txns-only?per_page=${TRANSACTIONS_PAGE_SIZE}`;
+      if (cursor) {
+        url += `&cursor=${cursor}`;
+      }
+      
+      const response = await fetchWithRetry(url, {
+        headers: this.headers
+      });
+
+      if (response.status === 404) {
+        this.log(`⚠️ Account not found: ${this.accountId}`);
+        return null;
+      }
+
+      if (response.status === 429) {
+        this.error("❌ NearBlocks API rate limit exceeded");
+        throw new BaseError(
+          "NearBlocks API rate limit exceeded",
+          ErrorCode.RATE_LIMIT_EXCEEDED
+        );
+      }
+
+      if (response.status === 403) {
+        throw new BaseError(
+          "Access forbidden. Check your API key.",
+          ErrorCode.FORBIDDEN
+        );
+      }
+
+      if (!response.ok) {
+        throw new BaseError(
+          `API request failed: ${response.status} ${response.statusText}`,
+          ErrorCode.NETWORK_ERROR
+        );
+      }
+
+      const data = await response.json();
+      return {
+        transactions: data.txns || [],
+        cursor: data.cursor || null
+      };
+    });
+  }
+
+  /**
+   * Returns the store key of the account's cached transactions for a month
+   */
+  private getCacheKey(year: number, month: number): string {
+    return `${TRANSACTIONS_CACHE_PREFIX}/${this.accountId}_${year}_${month.toString().padStart(2, '0')}.json`;
+  }
+
+  /**
+   * Reads the cached transactions of a month; a missing or unreadable cache is treated as empty
+   */
+  private async readCachedMonth(year: number, month: number): Promise<CachedTransactionMonth | null> {
+    if (!this.cacheStore) {
+      return null;
+    }
+
+    try {
+      return await this.cacheStore.read<CachedTransactionMonth>(this.getCacheKey(year, month));
+    } catch (error) {
+      this.logger?.warn("⚠️ Could not read cached NearBlocks transactions", { error });
+      return null;
+    }
+  }
+
+  /**
+   * Saves the transactions of a month for later runs (best-effort)
+   */
+  private async writeCachedMonth(year: number, month: number, cached: CachedTransactionMonth): Promise<void> {
+    if (!this.cacheStore) {
+      return;
+    }
+
+    try {
+      await this.cacheStore.write(this.getCacheKey(year, month), cached);
+    } catch (error) {
+      this.logger?.warn("⚠️ Could not save cached NearBlocks transactions", { error });
+    }
+  }
+
   /**
    * Fetches transaction data for the account from NearBlocks API using txns-only endpoint
+   * With a cache store, only transactions newer than the cached ones are requested,
+   * and months that had already ended are served from the cache entirely
    */
   async fetchTransactionData(year: number, month: number): Promise<NearTransactionData> {
-    const { startDate, endDate } = getDateRangeForMonth(year, month);
+    const { sinceTime, untilTime, startDateYMD, endDateYMD } = getMonthBounds(year, month);
     
     this.log(`🔍 Fetching transactions for account: ${this.accountId}`);
-    this.log(`📅 Period: ${startDate.toISOString().split('T')[0]} to ${endDate.toISOString().split('T')[0]}`);
-    
-    const allTransactions: NearTransaction[] = [];
-    let cursor: string | null = null;
-    const limit = 100;
-    let requestCount = 0;
+    this.log(`📅 Period: ${startDateYMD} to ${endDateYMD}`);
 
-    while (true) {
-      this.log(`🌐 Requesting data (request ${++requestCount})`);
-      
-      try {
-        const response = await this.withRateLimit(async () => {
-          // Build URL with cursor-based pagination
-          let url = `${this.baseUrl}/account/${this.accountId}/txns-only?per_page=${limit}`;
-          if (cursor) {
-            url += `&cursor=${cursor}`;
-          }
-          
-          const response = await fetch(url, {
-            headers: {
-              "Authorization": `Bearer ${this.apiKey}`,
-              "Accept": "application/json"
-            }
-          });
-
-          if (response.status === 404) {
-            this.log(`⚠️ Account not found: ${this.accountId}`);
-            return null;
-          }
+    const fetchStartTime = Date.now();
+    const cached = await this.readCachedMonth(year, month);
+    const cachedTransactions = cached?.transactions ?? [];
 
-          if (response.status === 429) {
-            this.error("❌ NearBlocks API rate limit exceeded");
-            throw new BaseError(
-              "NearBlocks API rate limit exceeded",
-              ErrorCode.RATE_LIMIT_EXCEEDED
-            );
-          }
+    if (cachedTransactions.length > 0) {
+      this.log(`💾 Loaded ${cachedTransactions.length} cached transactions`);
+      this.onTransactions?.(cachedTransactions);
+    }
 
-          if (response.status === 403) {
-            throw new BaseError(
-              "Access forbidden. Check your API key.",
-              ErrorCode.FORBIDDEN
-            );
-          }
+    if (cached?.complete) {
+      this.log("✅ Period already ended when cached, skipping NearBlocks requests");
+      return this.buildTransactionData(startDateYMD, endDateYMD, cachedTransactions);
+    }
 
-          if (!response.ok) {
-            throw new BaseError(
-              `API request failed: ${response.status} ${response.statusText}`,
-              ErrorCode.NETWORK_ERROR
-            );
-          }
+    // Cached transactions are newest first: anything older than the first one was already collected
+    const knownHashes = new Set(cachedTransactions.map(tx => tx.transaction_hash));
+    const stopTime = cachedTransactions.length > 0
+      ? Math.max(sinceTime, getTimestampMs(cachedTransactions[0]))
+      : sinceTime;
+    
+    const allTransactions: NearTransaction[] = [];
+    let requestCount = 1;
 
-          return response;
-        });
+    this.log(`🌐 Requesting data (request ${requestCount})`);
+    let nextPage: Promise<TransactionPage | null> = this.fetchTransactionPage(null);
 
-        if (!response) {
+    try {
+      while (true) {
+        const page = await nextPage;
+        if (!page) {
           break;
         }
 
-        const data = await response.json();
-        const transactions = data.txns || [];
-        cursor = data.cursor || null;
+        const { transactions, cursor } = page;
+
+        // Pages are newest first: once a page reaches back before the period (or the cached
+        // transactions), later pages are all older
+        const oldest = transactions[transactions.length - 1];
+        const reachedOlderTransactions = !!oldest && getTimestampMs(oldest) < stopTime;
+        const hasMorePages = !!cursor && transactions.length > 0 && !reachedOlderTransactions;
+
+        // Request the next page right away so it downloads while this one is processed;
+        // the shared rate limiter paces requests, so no fixed delay is needed
+        if (hasMorePages) {
+          this.log(`🌐 Requesting data (request ${++requestCount})`);
+          nextPage = this.fetchTransactionPage(cursor);
+          // If processing this page throws, the prefetch is never awaited; keep its failure
+          // from surfacing as an unhandled rejection (awaiting it still rethrows)
+          nextPage.catch(() => {});
+        }
         
-        // Filter transactions by timestamp since API doesn't support timestamp filtering
-        const filteredTransactions = transactions.filter((tx: NearTransaction) => {
-          const txTimestamp = parseInt(tx.block_timestamp) / 1e6; // Convert nanoseconds to milliseconds
-          const txDate = new Date(txTimestamp);
-          return txDate >= startDate && txDate <= endDate;
-        });
+        // Filter transactions by timestamp since API doesn't support timestamp filtering,
+        // keeping only the fields used downstream so the raw page can be released
+        const filteredTransactions = transactions
+          .filter((tx: NearTransaction) => {
+            const txTimestamp = getTimestampMs(tx);
+            return txTimestamp >= sinceTime && txTimestamp <= untilTime && !knownHashes.has(tx.transaction_hash);
+          })
+          .map(trimTransaction);
         
         this.log(`📄 Found ${transactions.length} transactions, ${filteredTransactions.length} in date range`);
         
-        if (filteredTransactions.length === 0 && transactions.length > 0) {
-          // If we have transactions but none in our date range, and they're newer than our end date, we can stop
-          for (const tx of transactions) {
-            const txTimestamp = parseInt(tx.block_timestamp) / 1e6;
-            const txDate = new Date(txTimestamp);
-            if (txDate < startDate) {
-              // We've gone too far back, stop here
-              this.log("📅 Reached transactions older than target period, stopping");
-              cursor = null;
-              break;
-            }
-          }
-        }
-        
         allTransactions.push(...filteredTransactions);
+        this.onTransactions?.(filteredTransactions);
         
-        // Break if no more cursor or no transactions
-        if (!cursor || transactions.length === 0) {
+        if (!hasMorePages) {
+          if (reachedOlderTransactions) {
+            this.log("📅 Reached transactions older than target period or already cached, stopping");
+          }
           break;
         }
-        
-        // Add delay between requests to avoid rate limiting
-        await new Promise(resolve => setTimeout(resolve, 500));
-        
-      } catch (error) {
-        this.error(`❌ Error in request: ${error}`);
-        throw error;
       }
+    } catch (error) {
+      this.error(`❌ Error in request: ${error}`);
+      throw error;
     }
 
+    // Append without spreading: a large cached month would exceed the engine's argument limit
+    for (const tx of cachedTransactions) {
+      allTransactions.push(tx);
+    }
     this.log(`✅ Total transactions found in period: ${allTransactions.length}`);
 
+    await this.writeCachedMonth(year, month, {
+      complete: fetchStartTime > untilTime,
+      transactions: allTransactions
+    });
+
+    return this.buildTransactionData(startDateYMD, endDateYMD, allTransactions);
+  }
+
+  /**
+   * Wraps the period's transactions with their metadata
+   */
+  private buildTransactionData(startDateYMD: string, endDateYMD: string, transactions: NearTransaction[]): NearTransactionData {
     return {
       metadata: {
         period: {
-          start_date: startDate.toISOString().split('T')[0],
-          end_date: endDate.toISOString().split('T')[0]
+          start_date: startDateYMD,
+          end_date: endDateYMD
         },
         account_id: this.accountId,
         timestamp: new Date().toISOString()
       },
-      transactions: allTransactions
+      transactions
     };
   }
 
@@ -5,41 +5,127 @@
 import dotenv from 'dotenv';
 import fs from 'fs';
 import path from 'path';
-import { S3Client, PutObjectCommand } from '@aws-sdk/client-s3';
+import zlib from 'zlib';
+import { promisify } from 'util';
+import { S3Client, PutObjectCommand, CopyObjectCommand } from '@aws-sdk/client-s3';
 import { OffchainCollector } from './collectors/offchain';
+import { createGitHubClient } from './collectors/github-client';
 import { OnchainCollector } from './collectors/onchain';
-import { OnchainCalculator } from './calculator/onchain';
+import { OnchainCalculator, OnchainMetricsAccumulator } from './calculator/onchain';
 import { OffchainCalculator } from './calculator/offchain';
 import { RewardsCalculator } from './calculator/rewards';
 import { ConsolidatedCalculator } from './calculator/consolidated';
-import { Logger, LogLevel } from './utils/logger';
+import { Logger, parseLogLevel } from './utils/logger';
 import { ErrorCode } from './types/errors';
 import { RateLimiter } from './utils/rate-limiter';
-import { GitHubMetrics } from './types/metrics';
+import { RateLimitState } from './utils/rate-limit-state';
+import { createConcurrencyLimiter, mapWithConcurrency } from './utils/concurrency';
+import { getMonthBounds } from './utils/date-utils';
+import { EtagCache } from './utils/etag-cache';
+import { JsonStore, LocalJsonStore, S3JsonStore } from './utils/json-store';
+import { GitHubMetrics, GitHubReviewSource } from './types/metrics';
 
 // Load environment variables
 dotenv.config();
 
-const GITHUB_TOKEN = process.env.GITHUB_TOKEN;
-const NEARBLOCKS_API_KEY = process.env.NEARBLOCKS_API_KEY;
-const SAVE_ON_S3 = process.env.SAVE_ON_S3 || false; // Set SAVE_ON_S3=true in .env to save results on AWS S3
-
-if (!GITHUB_TOKEN) {
-  console.error('❌ GITHUB_TOKEN environment variable is required');
-  process.exit(1);
+/**
+ * Reads a required environment variable, exiting at startup when it is missing
+ */
+function requireEnv(name: string): string {
+  const value = process.env[name];
+  if (!value) {
+    console.error(`❌ ${name} environment variable is required`);
+    process.exit(1);
+  }
+  return value;
 }
 
-if (!NEARBLOCKS_API_KEY) {
-  console.error('❌ NEARBLOCKS_API_KEY environment variable is required');
-  process.exit(1);
+// Values accepted as "on" for boolean environment switches
+const ENABLED_ENV_VALUES = new Set(['1', 'true', 'yes']);
+
+/**
+ * Reads a boolean environment switch (1, true or yes, case-insensitive)
+ */
+function isEnvEnabled(name: string): boolean {
+  return ENABLED_ENV_VALUES.has(process.env[name]?.trim().toLowerCase() ?? '');
 }
 
-// Create logger and rate limiter
-const logger = new Logger(LogLevel.INFO, 'NEAR Rewards');
-const rateLimiter = new RateLimiter(60, 60); // 60 requests per minute
+// Settings are read and validated once at startup
+const GITHUB_TOKEN = requireEnv('GITHUB_TOKEN');
+const NEARBLOCKS_API_KEY = requireEnv('NEARBLOCKS_API_KEY');
+const SAVE_ON_S3 = isEnvEnabled('SAVE_ON_S3'); // Set SAVE_ON_S3=true (or 1/yes) in .env to save results on AWS S3
+const AWS_REGION = process.env.AWS_REGION || 'us-east-2';
+const S3_BUCKET_NAME = "near-protocol-rewards-data-dashboard";
+const GITHUB_ETAG_CACHE_KEY = "cache/github_etags.json";
+const GZIP_LEVEL = 6; // Balanced compression ratio vs CPU for JSON uploads
+const gzipAsync = promisify(zlib.gzip);
+const S3_UPLOAD_CONCURRENCY = 8;
+const S3_MAX_ATTEMPTS = 3; // Initial request plus two retries
+// Set GITHUB_REVIEW_SOURCE=review_comments in .env to count PR review comments instead of submitted reviews
+const GITHUB_REVIEW_SOURCE: GitHubReviewSource =
+  process.env.GITHUB_REVIEW_SOURCE === 'review_comments' ? 'review_comments' : 'reviews';
+
+// Concurrency and API rate budgets
+const DEFAULT_PROJECT_CONCURRENCY = 4;
+// Set PROJECT_CONCURRENCY in .env to change how many projects are collected at the same time
+const PROJECT_CONCURRENCY = Math.max(1, Math.floor(Number(process.env.PROJECT_CONCURRENCY))) || DEFAULT_PROJECT_CONCURRENCY;
+const REPOSITORY_CONCURRENCY = 8; // Repositories collected at the same time across all projects
+const GITHUB_REQUESTS_PER_HOUR = 5000; // Authenticated GitHub REST quota
+const GITHUB_RATE_LIMIT_BURST = 100;
+const GITHUB_SEARCH_REQUESTS_PER_MINUTE = 30; // Authenticated Search API quota
+const GITHUB_SEARCH_RATE_LIMIT_BURST = 5; // Small bursts to stay clear of secondary rate limits
+const GITHUB_RATE_LIMIT_SAFETY_RATIO = 0.02; // Pause for the reset once less than 2% of a GitHub window remains
+const GITHUB_RESPONSE_CACHE_SIZE = 512; // GET responses kept in memory during the run for repositories shared by projects
+const GITHUB_CACHE_MAX_AGE_MS = 30 * 60 * 1000; // Reuse GitHub responses confirmed in the last 30 minutes without revalidating
+// Set GITHUB_CACHE_BUST=true in .env to ignore the GitHub responses cached by previous runs
+const GITHUB_CACHE_BUST = isEnvEnabled('GITHUB_CACHE_BUST');
+const NEARBLOCKS_REQUESTS_PER_MINUTE = 120;
+const NEARBLOCKS_RATE_LIMIT_BURST = 10;
+
+// Create logger and rate limiters (one token bucket per API instead of fixed sleeps between projects)
+const logger = new Logger(parseLogLevel(process.env.LOG_LEVEL), 'NEAR Rewards');
+const githubRateLimiter = new RateLimiter(GITHUB_RATE_LIMIT_BURST, GITHUB_REQUESTS_PER_HOUR / 3600);
+const githubSearchRateLimiter = new RateLimiter(GITHUB_SEARCH_RATE_LIMIT_BURST, GITHUB_SEARCH_REQUESTS_PER_MINUTE / 60);
+const nearblocksRateLimiter = new RateLimiter(NEARBLOCKS_RATE_LIMIT_BURST, NEARBLOCKS_REQUESTS_PER_MINUTE / 60);
+
+// Remaining GitHub budget as reported by the API, checked before each project
+const githubRateLimitState = new RateLimitState(GITHUB_RATE_LIMIT_SAFETY_RATIO);
+
+// Create a single GitHub client shared by all repositories, with conditional request and in-memory response caching
+const etagCache = new EtagCache(GITHUB_CACHE_MAX_AGE_MS);
+const githubClient = createGitHubClient(GITHUB_TOKEN, {
+  etagCache,
+  rateLimiter: githubRateLimiter,
+  searchRateLimiter: githubSearchRateLimiter,
+  rateLimitState: githubRateLimitState,
+  responseCacheSize: GITHUB_RESPONSE_CACHE_SIZE
+});
+
+// Caps repository collections in flight, so a project with many repositories cannot flood the GitHub client
+const limitRepositories = createConcurrencyLimiter(REPOSITORY_CONCURRENCY);
+
+// S3 client, created on first use so local-only runs never build one
+let s3Client: S3Client | undefined;
 
-// Create S3 client
-const s3Client = new S3Client({ region: process.env.AWS_REGION || 'us-east-2' });
+/**
+ * Returns the shared S3 client, creating it on first use
+ * Adaptive retry mode backs off client-side when S3 starts throttling parallel uploads
+ */
+function getS3Client(): S3Client {
+  if (!s3Client) {
+    s3Client = new S3Client({
+      region: AWS_REGION,
+      maxAttempts: S3_MAX_ATTEMPTS,
+      retryMode: 'adaptive'
+    });
+  }
+  return s3Client;
+}
+
+// Persistent caches live next to the results (S3 when enabled, local output folder otherwise)
+const cacheStore: JsonStore = SAVE_ON_S3
+  ? new S3JsonStore(getS3Client(), S3_BUCKET_NAME)
+  : new LocalJsonStore(path.join(__dirname, '..', 'output'));
 
 interface ProjectData {
   project: string;
@@ -58,9 +144,11 @@ interface ProjectResult {
   metrics_onchain?: any;
   rewards_onchain?: any;
   rawdata_onchain?: any;
+  rawdata_onchain_s3?: string; // S3 key of the raw on-chain data when stored separately
   metrics_offchain?: any;
   rewards_offchain?: any;
   rawdata_offchain?: any;
+  rawdata_offchain_s3?: string; // S3 key of the raw off-chain data when stored separately
   rewards_total?: any;
   error?: string;
 }
@@ -90,12 +178,62 @@ function isRateLimitError(error: unknown): boolean {
   return anyErr.code === ErrorCode.RATE_LIMITED || anyErr.code === ErrorCode.RATE_LIMIT_EXCEEDED;
 }
 
+/**
+ * Validates the entries of data.json once and normalizes their optional fields,
+ * so the rest of the pipeline can rely on wallet, website and repository being set
+ */
+function parseProjects(data: unknown): ProjectData[] {
+  if (!Array.isArray(data)) {
+    throw new Error('data.json must contain an array of projects');
+  }
+
+  return data.map((entry, index): ProjectData => {
+    if (!entry || typeof entry !== 'object' || typeof entry.project !== 'string' || !entry.project) {
+      throw new Error(`Invalid project at index ${index}: a "project" name is required`);
+    }
+
+    return {
+      project: entry.project,
+      wallet: typeof entry.wallet === 'string' ? entry.wallet.trim() : '',
+      website: typeof entry.website === 'string' ? entry.website : '',
+      repository: Array.isArray(entry.repository)
+        ? entry.repository.filter((repo: unknown): repo is string => typeof repo === 'string' && repo.length > 0)
+        : []
+    };
+  });
+}
+
+/**
+ * Builds the result skeleton shared by every project outcome
+ */
+function createProjectResult(project: ProjectData, period: string, timestamp: string): ProjectResult {
+  return {
+    project: project.project,
+    wallet: project.wallet,
+    website: project.website || "",
+    repository: project.repository,
+    period,
+    timestamp
+  };
+}
+
+// data.json ships with the deployment and does not change while the process lives
+let projectsCache: ProjectData[] | null = null;
+
+/**
+ * Loads the registered projects, reading and parsing data.json only on first use
+ */
 function loadProjectsData(): ProjectData[] {
+  if (projectsCache) {
+    return projectsCache;
+  }
+
   try {
     const dataPath = path.join(__dirname, 'data.json');
     const rawData = fs.readFileSync(dataPath, 'utf8');
-    const projects = JSON.parse(rawData);
+    const projects = parseProjects(JSON.parse(rawData));
     logger.info(`✅ Projects loaded successfully: ${projects.length} projects found`);
+    projectsCache = projects;
     return projects;
   } catch (error) {
     logger.error('❌ Error loading data.json', { error });
@@ -126,14 +264,17 @@ function saveResultsLocally(results: ProjectResult[], year: number, month: numbe
       }
     });
 
+    // Serialize once; the monthly and daily files share the same content
+    const resultsJson = JSON.stringify(results, null, 2);
+
     // Save monthly file (simulating S3 rewards folder)
     const monthlyFilePath = path.join(rewardsDir, `onchain_offchain_metrics_${year}_${month.toString().padStart(2, '0')}.json`);
-    fs.writeFileSync(monthlyFilePath, JSON.stringify(results, null, 2));
+    fs.writeFileSync(monthlyFilePath, resultsJson);
     logger.info(`✅ Monthly data saved locally: ${monthlyFilePath}`);
 
     // Save daily file (simulating S3 historical folder)
     const dailyFilePath = path.join(historicalDir, `onchain_offchain_metrics_${year}_${month.toString().padStart(2, '0')}_${currentDate.getDate().toString().padStart(2, '0')}.json`);
-    fs.writeFileSync(dailyFilePath, JSON.stringify(results, null, 2));
+    fs.writeFileSync(dailyFilePath, resultsJson);
     logger.info(`✅ Daily data saved locally: ${dailyFilePath}`);
 
     // Save consolidated dashboard file (simulating S3 dashboard folder)
@@ -159,9 +300,59 @@ function saveResultsLocally(results: ProjectResult[], year: number, month: numbe
   }
 }
 
+/**
+ * Gzips a JSON document for upload
+ * Compression runs on the libuv thread pool so concurrent uploads and collection are not blocked
+ */
+function gzipJson(json: string): Promise<Buffer> {
+  return gzipAsync(json, { level: GZIP_LEVEL });
+}
+
+/**
+ * Uploads a gzipped JSON body to the results bucket
+ * Objects keep their .json keys; Content-Encoding lets HTTP readers decompress transparently
+ */
+async function putJsonObject(key: string, body: Buffer): Promise<void> {
+  await getS3Client().send(new PutObjectCommand({
+    Bucket: S3_BUCKET_NAME,
+    Key: key,
+    Body: body,
+    ContentType: "application/json",
+    ContentEncoding: "gzip"
+  }));
+}
+
+/**
+ * Uploads each project's raw on-chain/off-chain data to its own S3 object
+ * Returns the results with the raw data replaced by the S3 keys it was written to
+ */
+async function saveRawDataToS3(results: ProjectResult[], year: number, month: number): Promise<ProjectResult[]> {
+  const period = `${year}_${month.toString().padStart(2, '0')}`;
+
+  return mapWithConcurrency(results, S3_UPLOAD_CONCURRENCY, async (result): Promise<ProjectResult> => {
+    const { rawdata_onchain, rawdata_offchain, ...summary } = result;
+    const projectSlug = result.project.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '');
+    const slimResult: ProjectResult = summary;
+
+    if (rawdata_onchain) {
+      const key = `raw/${projectSlug}/onchain_${period}.json`;
+      await putJsonObject(key, await gzipJson(JSON.stringify(rawdata_onchain)));
+      slimResult.rawdata_onchain_s3 = key;
+    }
+
+    if (rawdata_offchain) {
+      const key = `raw/${projectSlug}/offchain_${period}.json`;
+      await putJsonObject(key, await gzipJson(JSON.stringify(rawdata_offchain)));
+      slimResult.rawdata_offchain_s3 = key;
+    }
+
+    return slimResult;
+  });
+}
+
 async function saveResultsToS3(results: ProjectResult[], year: number, month: number, currentDate: Date, dashboardData?: any): Promise<S3SaveResult> {
   try {
-    const bucketName = "near-protocol-rewards-data-dashboard";
+    const bucketName = S3_BUCKET_NAME;
     
     // Monthly file
     const monthlyFileKey = `rewards/onchain_offchain_metrics_${year}_${month.toString().padStart(2, '0')}.json`;
@@ -172,44 +363,37 @@ async function saveResultsToS3(results: ProjectResult[], year: number, month: nu
     // Dashboard consolidated data file
     const dashboardFileKey = `dashboard/consolidated_metrics_${year}_${month.toString().padStart(2, '0')}.json`;
     
-    const resultsJson = JSON.stringify(results, null, 2);
-    
-    // Save monthly file
-    const monthlyCommand = new PutObjectCommand({
-      Bucket: bucketName,
-      Key: monthlyFileKey,
-      Body: resultsJson,
-      ContentType: "application/json"
-    });
-    
-    await s3Client.send(monthlyCommand);
-    
-    // Save daily file
-    const dailyCommand = new PutObjectCommand({
-      Bucket: bucketName,
-      Key: dailyFileKey,
-      Body: resultsJson,
-      ContentType: "application/json"
-    });
-    
-    await s3Client.send(dailyCommand);
-    
-    let dashboardPath;
-    
-    // Save dashboard consolidated data if provided
-    if (dashboardData) {
-      const dashboardJson = JSON.stringify(dashboardData, null, 2);
-      
-      const dashboardCommand = new PutObjectCommand({
-        Bucket: bucketName,
-        Key: dashboardFileKey,
-        Body: dashboardJson,
-        ContentType: "application/json"
-      });
-      
-      await s3Client.send(dashboardCommand);
-      dashboardPath = `s3://${bucketName}/${dashboardFileKey}`;
-    }
+    // The dashboard object does not depend on the results files, so upload it alongside them
+    const dashboardUpload = dashboardData
+      ? gzipJson(JSON.stringify(dashboardData)).then(body => putJsonObject(dashboardFileKey, body))
+      : Promise.resolve();
+
+    const resultsUpload = (async () => {
+      // Raw data goes to per-project objects so the aggregated files only hold metrics and rewards
+      const slimResults = await saveRawDataToS3(results, year, month);
+
+      // Serialize and compress once
+      const resultsBody = await gzipJson(JSON.stringify(slimResults));
+
+      // Save monthly file
+      await putJsonObject(monthlyFileKey, resultsBody);
+
+      // Save daily file as a server-side copy of the monthly one (object metadata is copied too)
+      try {
+        await getS3Client().send(new CopyObjectCommand({
+          Bucket: bucketName,
+          Key: dailyFileKey,
+          CopySource: encodeURI(`${bucketName}/${monthlyFileKey}`)
+        }));
+      } catch (error) {
+        logger.warn('⚠️ Could not copy monthly file to daily key, uploading it instead', { error });
+        await putJsonObject(dailyFileKey, resultsBody);
+      }
+    })();
+
+    await Promise.all([resultsUpload, dashboardUpload]);
+
+    const dashboardPath = dashboardData ? `s3://${bucketName}/${dashboardFileKey}` : undefined;
     
     const monthlyPath = `s3://${bucketName}/${monthlyFileKey}`;
     const dailyPath = `s3://${bucketName}/${dailyFileKey}`;
@@ -233,19 +417,23 @@ async function saveResultsToS3(results: ProjectResult[], year: number, month: nu
   }
 }
 
-async function saveLogsToS3(year: number, month: number, currentDate: Date, logsJson: string): Promise<LogsSaveResult> {
+/**
+ * Saves the run's log entries to S3 as a single compact JSON document
+ *
+ * @param runError Error that aborted the run, if any
+ */
+async function saveLogsToS3(year: number, month: number, currentDate: Date, runError?: unknown): Promise<LogsSaveResult> {
   try {
-    const bucketName = "near-protocol-rewards-data-dashboard";
-    const logsKey = `logs/run_${year}_${month.toString().padStart(2, '0')}_${currentDate.getDate().toString().padStart(2, '0')}_${currentDate.toISOString().split('T')[1].replace(/[:.Z]/g, '-')}.json`;
-
-    const command = new PutObjectCommand({
-      Bucket: bucketName,
-      Key: logsKey,
-      Body: logsJson,
-      ContentType: "application/json"
+    const logsJson = JSON.stringify({
+      period: getMonthBounds(year, month).period,
+      timestamp: currentDate.toISOString(),
+      ...(runError !== undefined && { error: String(runError) }),
+      logs: logger.getEntries(),
     });
+    const bucketName = S3_BUCKET_NAME;
+    const logsKey = `logs/run_${year}_${month.toString().padStart(2, '0')}_${currentDate.getDate().toString().padStart(2, '0')}_${currentDate.toISOString().split('T')[1].replace(/[:.Z]/g, '-')}.json`;
 
-    await s3Client.send(command);
+    await putJsonObject(logsKey, await gzipJson(logsJson));
 
     const logsPath = `s3://${bucketName}/${logsKey}`;
     logger.info(`✅ Logs saved to S3: ${logsPath}`);
@@ -257,38 +445,69 @@ async function saveLogsToS3(year: number, month: number, currentDate: Date, logs
   }
 }
 
+/**
+ * Loads the GitHub conditional request cache from the previous run (best-effort)
+ */
+async function loadGitHubCache(): Promise<void> {
+  if (GITHUB_CACHE_BUST) {
+    logger.info('ℹ️ GITHUB_CACHE_BUST is set, fetching every GitHub resource again');
+    return;
+  }
+
+  try {
+    await etagCache.load(cacheStore, GITHUB_ETAG_CACHE_KEY);
+    logger.info(`✅ GitHub ETag cache loaded: ${etagCache.getStats().entries} entries`);
+  } catch (error) {
+    logger.warn('⚠️ Could not load GitHub ETag cache, starting empty', { error });
+  }
+}
+
+/**
+ * Persists the GitHub conditional request cache for the next run (best-effort)
+ */
+async function saveGitHubCache(): Promise<void> {
+  try {
+    await etagCache.save(cacheStore, GITHUB_ETAG_CACHE_KEY);
+    const { hits, misses } = etagCache.getStats();
+    logger.info(`✅ GitHub ETag cache saved (${hits} not-modified hits, ${misses} fresh responses)`);
+  } catch (error) {
+    logger.warn('⚠️ Could not save GitHub ETag cache', { error });
+  }
+}
+
 async function processProject(
   project: ProjectData,
   year: number,
   month: number,
+  runTimestamp: string,
   offchainCalculator: OffchainCalculator,
   onchainCalculator: OnchainCalculator,
   rewardsCalculator: RewardsCalculator
 ): Promise<ProjectResult> {
-  const currentDate = new Date();
-  const projectResult: ProjectResult = {
-    project: project.project,
-    wallet: project.wallet,
-    website: project.website || "",
-    repository: project.repository || [],
-    period: `${year}-${month.toString().padStart(2, '0')}`,
-    timestamp: currentDate.toISOString()
-  };
+  const projectResult = createProjectResult(project, getMonthBounds(year, month).period, runTimestamp);
 
   try {
     let rewardsOnchain: any = undefined;
     let rewardsOffchain: any = undefined;
 
-    // Process on-chain data if wallet exists
-    if (project.wallet) {
+    // Process on-chain data if wallet exists; returns the error message on non-critical failures
+    const processOnchain = async (): Promise<string | undefined> => {
+      if (!project.wallet) {
+        return undefined;
+      }
+
       logger.info(`📊 Collecting on-chain data for ${project.wallet}...`);
       
       try {
+        // Metrics are folded page by page while the transactions are being fetched
+        const onchainAccumulator = new OnchainMetricsAccumulator(project.wallet);
         const onchainCollector = new OnchainCollector({
-          apiKey: NEARBLOCKS_API_KEY!,
+          apiKey: NEARBLOCKS_API_KEY,
           accountId: project.wallet,
           logger,
-          rateLimiter
+          rateLimiter: nearblocksRateLimiter,
+          onTransactions: (transactions) => onchainAccumulator.addTransactions(transactions),
+          cacheStore // Daily reruns only fetch transactions newer than the cached ones
         });
 
         // Collect transaction data
@@ -296,8 +515,7 @@ async function processProject(
         if (!transactionData) {
           logger.warn(`⚠️ On-chain account not found or no data for ${project.wallet}. Skipping on-chain metrics.`);
         } else {
-          // Calculate metrics from raw data
-          const metricsOnchain = onchainCalculator.calculateOnchainMetricsFromTransactionData(transactionData);
+          const metricsOnchain = onchainCalculator.finalizeOnchainMetrics(onchainAccumulator);
           
           // Calculate on-chain rewards
           const onchainResult = onchainCalculator.calculateOnchainScores(metricsOnchain);
@@ -309,47 +527,50 @@ async function processProject(
 
           logger.info(`✅ On-chain data processed for ${project.wallet}`);
         }
+        return undefined;
       } catch (error) {
         logger.error(`❌ Error processing on-chain data for ${project.wallet}`, { error });
         if (isRateLimitError(error)) {
           // Propagate to stop the whole pipeline
           throw error;
         }
-        projectResult.error = `On-chain error: ${String((error as Error)?.message || error)}`;
+        return `On-chain error: ${String((error as Error)?.message || error)}`;
+      }
+    };
+
+    // Process off-chain data if repositories exist; returns the error message on non-critical failures
+    const processOffchain = async (): Promise<string | undefined> => {
+      if (project.repository.length === 0) {
+        return undefined;
       }
-    }
 
-    // Process off-chain data if repositories exist
-    if (project.repository && project.repository.length > 0) {
       logger.info(`📈 Collecting off-chain data for repositories...`);
       
       try {
-        const repositoryMetrics: GitHubMetrics[] = [];
-        
-        // Process each repository
-        for (const repo of project.repository) {
+        // Process the project's repositories concurrently, bounded across projects by the shared repository limiter;
+        // requests are paced by the shared GitHub rate limiter
+        const collectedMetrics = await Promise.all(project.repository.map((repo) => limitRepositories(async (): Promise<GitHubMetrics | null> => {
           logger.info(`🔍 Analyzing repository: ${repo}`);
 
           try {
             const collector = new OffchainCollector({
-              token: GITHUB_TOKEN!,
+              token: GITHUB_TOKEN,
               repo,
-              logger,
-              rateLimiter
+              octokit: githubClient, // Paced per request by the GitHub rate limiter
+              reviewSource: GITHUB_REVIEW_SOURCE,
+              logger
             });
-            const metrics = await collector.collectData(year, month);
-            repositoryMetrics.push(metrics);
+            return await collector.collectData(year, month);
           } catch (error) {
             logger.error(`❌ Error collecting metrics for repo ${repo}`, { error });
             if (isRateLimitError(error)) {
               throw error; // stop everything on rate limit
             }
-            // For NOT_FOUND or other non-critical errors, continue to next repo
+            // For NOT_FOUND or other non-critical errors, skip this repo
+            return null;
           }
-
-          // Add small delay between repositories to respect rate limits
-          await new Promise(resolve => setTimeout(resolve, 1000));
-        }
+        })));
+        const repositoryMetrics = collectedMetrics.filter((metrics): metrics is GitHubMetrics => metrics !== null);
         
         if (repositoryMetrics.length > 0) {
           // Combine metrics from all repositories
@@ -365,13 +586,21 @@ async function processProject(
 
           logger.info(`✅ Off-chain data processed for ${project.repository.length} repositories`);
         }
+        return undefined;
       } catch (error) {
         logger.error(`❌ Error processing off-chain data for ${project.project}`, { error });
         if (isRateLimitError(error)) {
           throw error;
         }
-        projectResult.error = `Off-chain error: ${String((error as Error)?.message || error)}`;
+        return `Off-chain error: ${String((error as Error)?.message || error)}`;
       }
+    };
+
+    // NearBlocks and GitHub are independent, so both sides are collected at the same time
+    const [onchainError, offchainError] = await Promise.all([processOnchain(), processOffchain()]);
+    const collectionError = offchainError ?? onchainError;
+    if (collectionError) {
+      projectResult.error = collectionError;
     }
 
     // Calculate total rewards if we have at least one type of data
@@ -404,11 +633,15 @@ async function main() {
   try {
     // Load projects from data.json
     const projects = loadProjectsData();
+    await loadGitHubCache();
     
     // Set processing period (current month/year or could be parameterized)
     const currentDate = new Date();
     const year = currentDate.getFullYear();
     const month = currentDate.getMonth() + 1; // JavaScript months are 0-indexed
+    // Every project result of this run shares the same period and timestamp
+    const { period } = getMonthBounds(year, month);
+    const runTimestamp = currentDate.toISOString();
     
     logger.info(`🚀 Starting data collection for ${month}/${year}`);
     logger.info(`🔍 Total projects to process: ${projects.length}`);
@@ -419,11 +652,20 @@ async function main() {
     const rewardsCalculator = new RewardsCalculator(logger);
     const consolidatedCalculator = new ConsolidatedCalculator(logger);
     
-    const results: ProjectResult[] = [];
-    
-    // Process each project (only fail fast on rate limit)
-    for (let index = 0; index < projects.length; index++) {
-      const project = projects[index];
+    // Process projects concurrently (only fail fast on rate limit)
+    const results = await mapWithConcurrency(projects, PROJECT_CONCURRENCY, async (project, index): Promise<ProjectResult> => {
+      // Nothing to collect: return the empty result right away without waiting on rate limits
+      if (!project.wallet && project.repository.length === 0) {
+        logger.warn(`⚠️ Skipping project ${project.project}: no wallet or repositories configured`);
+        return createProjectResult(project, period, runTimestamp);
+      }
+
+      // Only pause when GitHub reports the remaining core budget is nearly exhausted
+      const waitedMs = await githubRateLimitState.waitIfNeeded('core');
+      if (waitedMs > 0) {
+        logger.info(`⏳ Waited ${Math.ceil(waitedMs / 1000)}s for the GitHub rate limit to reset`);
+      }
+
       logger.info(`\n🔄 Processing project: ${project.project} (${index + 1}/${projects.length})`);
 
       try {
@@ -431,42 +673,37 @@ async function main() {
           project,
           year,
           month,
+          runTimestamp,
           offchainCalculator,
           onchainCalculator,
           rewardsCalculator
         );
 
-        results.push(projectResult);
         logger.info(`✅ Project ${project.project} processed successfully!`);
+        return projectResult;
       } catch (error) {
         logger.error(`❌ Error processing project ${project.project}`, { error });
         if (isRateLimitError(error)) {
           throw error; // stop entire run
         }
-        const errorResult: ProjectResult = {
-          project: project.project,
-          wallet: project.wallet,
-          website: project.website || "",
-          repository: project.repository || [],
-          period: `${year}-${month.toString().padStart(2, '0')}`,
-          timestamp: currentDate.toISOString(),
+        return {
+          ...createProjectResult(project, period, runTimestamp),
           error: `${String((error as Error)?.message || error)}`
         };
-        results.push(errorResult);
       }
-
-      // Add delay every 5 projects to respect API rate limits
-      if ((index + 1) % 5 === 0 && index < projects.length - 1) {
-        logger.info('⏳ Waiting 1 minute to respect API rate limits...');
-        await new Promise(resolve => setTimeout(resolve, 60000)); // 1 minute
-      }
-    }
+    });
     
     // Output final results
     logger.info('\n🎉 Processing completed! Final results:');
     logger.info(`📊 Projects processed: ${results.length}`);
-    logger.info(`✅ Successful projects: ${results.filter(p => !p.error).length}`);
-    logger.info(`❌ Failed projects: ${results.filter(p => p.error).length}`);
+    let failedCount = 0;
+    for (const result of results) {
+      if (result.error) {
+        failedCount++;
+      }
+    }
+    logger.info(`✅ Successful projects: ${results.length - failedCount}`);
+    logger.info(`❌ Failed projects: ${failedCount}`);
 
     // Calculate consolidated dashboard data
     logger.info('\n📊 Calculating consolidated dashboard data...');
@@ -479,6 +716,8 @@ async function main() {
     // Save all data locally (fail fast on error)
     const localPaths = saveResultsLocally(results, year, month, currentDate, consolidatedData);
     logger.info('✅ All data saved locally successfully!');
+
+    await saveGitHubCache();
        
     // Save results to S3 if enabled
     if (SAVE_ON_S3) {
@@ -487,12 +726,7 @@ async function main() {
       logger.info('✅ Results successfully saved to S3!');
 
       // Save logs to S3 as well
-      const logsJson = JSON.stringify({
-        period: `${year}-${month.toString().padStart(2, '0')}`,
-        timestamp: currentDate.toISOString(),
-        logs: logger.getEntries(),
-      }, null, 2);
-      await saveLogsToS3(year, month, currentDate, logsJson);
+      await saveLogsToS3(year, month, currentDate);
     }
   
     // Log summary for each project
@@ -523,13 +757,7 @@ async function main() {
     try {
       if (SAVE_ON_S3) {
         const now = new Date();
-        const logsJson = JSON.stringify({
-          period: `${now.getFullYear()}-${(now.getMonth()+1).toString().padStart(2, '0')}`,
-          timestamp: now.toISOString(),
-          error: String(error),
-          logs: logger.getEntries(),
-        }, null, 2);
-        await saveLogsToS3(now.getFullYear(), now.getMonth()+1, now, logsJson);
+        await saveLogsToS3(now.getFullYear(), now.getMonth()+1, now, error);
       }
     } catch (e) {
       // Ignore secondary failure while saving logs
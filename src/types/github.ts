@@ -9,6 +9,7 @@ export interface GitHubPullRequest {
   } | null;
   state: string;
   created_at: string;
+  updated_at: string;
   merged_at: string | null;
 }
 
@@ -40,4 +41,47 @@ export interface GitHubReview {
     login: string;
   } | null;
   submitted_at: string;
-} 
\ No newline at end of file
+}
+
+export interface GitHubReviewComment {
+  user: {
+    login: string;
+  } | null;
+  created_at: string;
+}
+
+export interface GitHubGraphQLReview {
+  author: {
+    login: string;
+  } | null;
+  submittedAt: string | null;
+}
+
+export interface GitHubGraphQLPullRequest {
+  number: number;
+  createdAt: string;
+  updatedAt: string;
+  state: "OPEN" | "CLOSED" | "MERGED";
+  mergedAt: string | null;
+  author: {
+    login: string;
+  } | null;
+  reviews: {
+    pageInfo: {
+      hasNextPage: boolean;
+    };
+    nodes: GitHubGraphQLReview[];
+  };
+}
+
+export interface GitHubPullRequestsQueryResult {
+  repository: {
+    pullRequests: {
+      pageInfo: {
+        hasNextPage: boolean;
+        endCursor: string | null;
+      };
+      nodes: GitHubGraphQLPullRequest[];
+    };
+  };
+}
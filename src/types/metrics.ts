@@ -26,9 +26,13 @@ export interface GitHubPullRequestMetrics {
   authors: string[];
 }
 
+// What the review metrics count: submitted PR reviews or individual PR review comments
+export type GitHubReviewSource = "reviews" | "review_comments";
+
 export interface GitHubReviewMetrics {
   count: number;
   authors: string[];
+  source?: GitHubReviewSource;
 }
 
 export interface GitHubIssueMetrics {
@@ -75,6 +79,9 @@ export interface OffchainRewards {
 
 // On-chain metrics types
 
+// Amount in yoctoNEAR (10^-24 NEAR); large values may arrive as decimal strings
+export type YoctoAmount = number | string;
+
 export interface NearTransaction {
   id: string;
   transaction_hash: string;
@@ -83,7 +90,7 @@ export interface NearTransaction {
   block_timestamp: string;
   actions: NearAction[];
   actions_agg: {
-    deposit: number;
+    deposit?: YoctoAmount | null; // Missing when NearBlocks does not aggregate the actions
   };
   outcomes?: {
     status: boolean;
@@ -99,7 +106,7 @@ export interface NearTransaction {
 export interface NearAction {
   action: string;
   method: string | null;
-  deposit: number;
+  deposit: YoctoAmount;
   fee: number;
   args: string | null;
 }
@@ -0,0 +1,67 @@
+/**
+ * Concurrency utility functions
+ *
+ * Provides helpers to run independent async tasks in parallel with a bounded
+ * number of in-flight operations.
+ */
+
+/**
+ * Maps items through an async function with at most `limit` calls in flight
+ * Results are returned in the same order as the input items
+ *
+ * @param items Items to process
+ * @param limit Maximum number of concurrent calls
+ * @param fn Async function applied to each item
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  const workerCount = Math.max(1, Math.min(limit, items.length));
+  let nextIndex = 0;
+
+  const worker = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  await Promise.all(Array.from({ length: workerCount }, () => worker()));
+
+  return results;
+}
+
+/**
+ * Creates a limiter that runs at most `limit` async tasks at a time across all callers
+ * Tasks beyond the limit wait in FIFO order until a running task settles
+ *
+ * @param limit Maximum number of concurrent tasks
+ */
+export function createConcurrencyLimiter(limit: number): <R>(task: () => Promise<R>) => Promise<R> {
+  const maxActive = Math.max(1, limit);
+  const waiting: (() => void)[] = [];
+  let active = 0;
+
+  return async <R>(task: () => Promise<R>): Promise<R> => {
+    if (active >= maxActive) {
+      await new Promise<void>(resolve => waiting.push(resolve));
+    } else {
+      active++;
+    }
+
+    try {
+      return await task();
+    } finally {
+      // Hand the slot straight to the next waiting task, if any
+      const next = waiting.shift();
+      if (next) {
+        next();
+      } else {
+        active--;
+      }
+    }
+  };
+}
@@ -15,17 +15,55 @@ export function getDateRangeForMonth(year: number, month: number): { startDate:
   return { startDate, endDate };
 }
 
+/**
+ * Precomputed representations of a month's date range
+ */
+export interface MonthBounds {
+  since: string; // ISO timestamp of the month start
+  until: string; // ISO timestamp of the month end
+  sinceTime: number; // Epoch milliseconds of the month start
+  untilTime: number; // Epoch milliseconds of the month end
+  startDateYMD: string; // Month start as YYYY-MM-DD
+  endDateYMD: string; // Month end as YYYY-MM-DD
+  period: string; // Reporting period label as YYYY-MM
+}
+
+// Bounds are requested for the same month by every collector, so compute them once
+const monthBoundsCache = new Map<string, Readonly<MonthBounds>>();
+
+/**
+ * Gets the date range for a specific year and month in every format the collectors use
+ * Results are memoized per month
+ */
+export function getMonthBounds(year: number, month: number): Readonly<MonthBounds> {
+  const key = `${year}-${month}`;
+  let bounds = monthBoundsCache.get(key);
+
+  if (!bounds) {
+    const { startDate, endDate } = getDateRangeForMonth(year, month);
+    bounds = Object.freeze({
+      since: startDate.toISOString(),
+      until: endDate.toISOString(),
+      sinceTime: startDate.getTime(),
+      untilTime: endDate.getTime(),
+      startDateYMD: formatDateYMD(startDate),
+      endDateYMD: formatDateYMD(endDate),
+      period: `${year}-${month.toString().padStart(2, '0')}`
+    });
+    monthBoundsCache.set(key, bounds);
+  }
+
+  return bounds;
+}
+
 /**
  * Gets the date range for a specific year and month in ISO string format
  * Returns ISO strings for start and end of the month (used by GitHub API)
  */
 export function getDateRangeForMonthIso(year: number, month: number): { since: string; until: string } {
-  const { startDate, endDate } = getDateRangeForMonth(year, month);
+  const { since, until } = getMonthBounds(year, month);
   
-  return {
-    since: startDate.toISOString(),
-    until: endDate.toISOString()
-  };
+  return { since, until };
 }
 
 /**
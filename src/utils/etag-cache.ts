@@ -0,0 +1,104 @@
+/**
+ * ETag Cache Utility
+ *
+ * Keeps the last response body and ETag for each GitHub GET URL so repeated
+ * runs can send conditional requests (If-None-Match). GitHub answers unchanged
+ * resources with 304 Not Modified, which does not count against the rate limit.
+ */
+
+import { JsonStore } from './json-store';
+
+export interface CachedResponse {
+  etag: string;
+  status: number;
+  url: string;
+  headers: Record<string, string>;
+  data: unknown;
+  storedAt?: number; // Epoch ms when the body was last confirmed current (fetched or revalidated)
+}
+
+export class EtagCache {
+  private entries = new Map<string, CachedResponse>();
+  private readonly touched = new Set<string>();
+  private readonly maxAgeMs: number;
+  private hits = 0;
+  private misses = 0;
+
+  /**
+   * Creates a new ETag cache
+   *
+   * @param maxAgeMs How long a confirmed body is reused without revalidating (0 always revalidates)
+   */
+  constructor(maxAgeMs: number = 0) {
+    this.maxAgeMs = maxAgeMs;
+  }
+
+  /**
+   * Returns the cached response for a URL, if any
+   */
+  get(url: string): CachedResponse | undefined {
+    return this.entries.get(url);
+  }
+
+  /**
+   * Returns the cached response for a URL if it was confirmed within the max age,
+   * meaning it can be served without sending a conditional request
+   */
+  getFresh(url: string, now: number = Date.now()): CachedResponse | undefined {
+    const entry = this.entries.get(url);
+    if (!entry || entry.storedAt === undefined || now - entry.storedAt >= this.maxAgeMs) {
+      return undefined;
+    }
+    return entry;
+  }
+
+  /**
+   * Stores a fresh response for a URL
+   */
+  set(url: string, response: CachedResponse): void {
+    this.entries.set(url, { ...response, storedAt: Date.now() });
+    this.touched.add(url);
+    this.misses++;
+  }
+
+  /**
+   * Records that a cached response was reused, either within its max age or after a 304
+   */
+  markHit(url: string, revalidated: boolean = true): void {
+    const entry = this.entries.get(url);
+    if (entry && revalidated) {
+      entry.storedAt = Date.now();
+    }
+    this.touched.add(url);
+    this.hits++;
+  }
+
+  /**
+   * Returns hit/miss counters for the current run
+   */
+  getStats(): { hits: number; misses: number; entries: number } {
+    return { hits: this.hits, misses: this.misses, entries: this.entries.size };
+  }
+
+  /**
+   * Loads previously persisted entries from a store
+   */
+  async load(store: JsonStore, key: string): Promise<void> {
+    const stored = await store.read<Record<string, CachedResponse>>(key);
+    this.entries = new Map(Object.entries(stored || {}));
+  }
+
+  /**
+   * Persists the entries used during this run, dropping stale ones
+   */
+  async save(store: JsonStore, key: string): Promise<void> {
+    const snapshot: Record<string, CachedResponse> = {};
+    for (const url of this.touched) {
+      const entry = this.entries.get(url);
+      if (entry) {
+        snapshot[url] = entry;
+      }
+    }
+    await store.write(key, snapshot);
+  }
+}
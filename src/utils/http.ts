@@ -0,0 +1,90 @@
+/**
+ * HTTP utility functions
+ *
+ * Provides a fetch wrapper that retries rate-limited and transient server
+ * failures with exponential backoff, honoring Retry-After when present.
+ */
+
+export interface RetryOptions {
+  retries: number;
+  backoffMs: number;
+  retryStatuses: readonly number[];
+  maxRetryAfterMs: number; // Longest Retry-After the wrapper will wait before giving the response back
+}
+
+export const DEFAULT_RETRY_OPTIONS: RetryOptions = {
+  retries: 5,
+  backoffMs: 300,
+  retryStatuses: [429, 500, 502, 503, 504],
+  maxRetryAfterMs: 60000,
+};
+
+/**
+ * Waits for the given number of milliseconds
+ */
+export function sleep(ms: number): Promise<void> {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+/**
+ * Parses a Retry-After header (delay in seconds or an HTTP date) into milliseconds
+ * Returns null when the header is absent or invalid
+ */
+export function parseRetryAfter(header: string | null, now: number = Date.now()): number | null {
+  if (!header) {
+    return null;
+  }
+
+  const seconds = Number(header);
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(header);
+  return Number.isNaN(date) ? null : Math.max(0, date - now);
+}
+
+/**
+ * Performs a fetch, retrying on network errors and retryable status codes
+ * The last response (or error) is returned to the caller when retries are exhausted
+ *
+ * @param url Request URL
+ * @param init Fetch options
+ * @param options Retry configuration
+ */
+export async function fetchWithRetry(
+  url: string,
+  init: RequestInit,
+  options: RetryOptions = DEFAULT_RETRY_OPTIONS
+): Promise<Response> {
+  for (let attempt = 0; ; attempt++) {
+    const isLastAttempt = attempt >= options.retries;
+
+    let delayMs = options.backoffMs * 2 ** attempt;
+
+    try {
+      const response = await fetch(url, init);
+      if (isLastAttempt || !options.retryStatuses.includes(response.status)) {
+        return response;
+      }
+
+      // Wait as long as the server asks, unless that is longer than we are willing to block
+      const retryAfterMs = parseRetryAfter(response.headers.get("retry-after"));
+      if (retryAfterMs !== null) {
+        if (retryAfterMs > options.maxRetryAfterMs) {
+          return response;
+        }
+        delayMs = retryAfterMs;
+      }
+
+      // Discard the body so the pooled connection can be reused
+      await response.body?.cancel();
+    } catch (error) {
+      if (isLastAttempt) {
+        throw error;
+      }
+    }
+
+    await sleep(delayMs);
+  }
+}
@@ -4,4 +4,10 @@
 
 export * from './logger';
 export * from './rate-limiter';
-export * from './date-utils'; 
\ No newline at end of file
+export * from './rate-limit-state';
+export * from './date-utils';
+export * from './concurrency';
+export * from './http';
+export * from './json-store';
+export * from './etag-cache';
+export * from './lru-cache';
\ No newline at end of file
@@ -0,0 +1,89 @@
+/**
+ * JSON Store Utility
+ *
+ * Persists small JSON documents (caches, checkpoints) either on the local
+ * filesystem or in an S3 bucket behind a common interface.
+ */
+
+import fs from 'fs';
+import path from 'path';
+import { S3Client, GetObjectCommand, PutObjectCommand } from '@aws-sdk/client-s3';
+
+export interface JsonStore {
+  /**
+   * Reads a JSON document, returning null when it does not exist
+   */
+  read<T>(key: string): Promise<T | null>;
+
+  /**
+   * Writes a JSON document, replacing any previous version
+   */
+  write(key: string, value: unknown): Promise<void>;
+}
+
+/**
+ * Stores JSON documents as files under a base directory
+ */
+export class LocalJsonStore implements JsonStore {
+  private readonly baseDir: string;
+
+  constructor(baseDir: string) {
+    this.baseDir = baseDir;
+  }
+
+  async read<T>(key: string): Promise<T | null> {
+    try {
+      const raw = await fs.promises.readFile(path.join(this.baseDir, key), 'utf8');
+      return JSON.parse(raw) as T;
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException)?.code === 'ENOENT') {
+        return null;
+      }
+      throw error;
+    }
+  }
+
+  async write(key: string, value: unknown): Promise<void> {
+    const filePath = path.join(this.baseDir, key);
+    await fs.promises.mkdir(path.dirname(filePath), { recursive: true });
+    await fs.promises.writeFile(filePath, JSON.stringify(value));
+  }
+}
+
+/**
+ * Stores JSON documents as objects in an S3 bucket
+ */
+export class S3JsonStore implements JsonStore {
+  private readonly client: S3Client;
+  private readonly bucket: string;
+
+  constructor(client: S3Client, bucket: string) {
+    this.client = client;
+    this.bucket = bucket;
+  }
+
+  async read<T>(key: string): Promise<T | null> {
+    try {
+      const response = await this.client.send(new GetObjectCommand({
+        Bucket: this.bucket,
+        Key: key
+      }));
+      const raw = await response.Body?.transformToString();
+      return raw ? JSON.parse(raw) as T : null;
+    } catch (error) {
+      if ((error as { name?: string })?.name === 'NoSuchKey') {
+        return null;
+      }
+      throw error;
+    }
+  }
+
+  async write(key: string, value: unknown): Promise<void> {
+    await this.client.send(new PutObjectCommand({
+      Bucket: this.bucket,
+      Key: key,
+      Body: JSON.stringify(value),
+      ContentType: "application/json"
+    }));
+  }
+}
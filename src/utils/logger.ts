@@ -11,6 +11,15 @@ export enum LogLevel {
   ERROR = 3,
 }
 
+/**
+ * Parses a level name such as "debug" or "WARN" (e.g. from LOG_LEVEL)
+ * Returns the fallback when the value is missing or unknown
+ */
+export function parseLogLevel(value: string | undefined, fallback: LogLevel = LogLevel.INFO): LogLevel {
+  const level: unknown = value ? LogLevel[value.trim().toUpperCase() as keyof typeof LogLevel] : undefined;
+  return typeof level === 'number' ? level : fallback;
+}
+
 export interface LogEntry {
   level: LogLevel;
   message: string;
@@ -41,10 +50,7 @@ export class Logger {
    * @param context Optional context object
    */
   debug(message: string, context?: Record<string, unknown>): void {
-    if (this.level <= LogLevel.DEBUG) {
-      console.debug(`${this.prefix}${message}`, context || '');
-    }
-    this.entries.push({ level: LogLevel.DEBUG, message: `${this.prefix}${message}`, timestamp: new Date().toISOString(), context });
+    this.log(LogLevel.DEBUG, console.debug, message, context);
   }
 
   /**
@@ -54,10 +60,7 @@ export class Logger {
    * @param context Optional context object
    */
   info(message: string, context?: Record<string, unknown>): void {
-    if (this.level <= LogLevel.INFO) {
-      console.info(`${this.prefix}${message}`, context || '');
-    }
-    this.entries.push({ level: LogLevel.INFO, message: `${this.prefix}${message}`, timestamp: new Date().toISOString(), context });
+    this.log(LogLevel.INFO, console.info, message, context);
   }
 
   /**
@@ -67,10 +70,7 @@ export class Logger {
    * @param context Optional context object
    */
   warn(message: string, context?: Record<string, unknown>): void {
-    if (this.level <= LogLevel.WARN) {
-      console.warn(`${this.prefix}${message}`, context || '');
-    }
-    this.entries.push({ level: LogLevel.WARN, message: `${this.prefix}${message}`, timestamp: new Date().toISOString(), context });
+    this.log(LogLevel.WARN, console.warn, message, context);
   }
 
   /**
@@ -80,10 +80,25 @@ export class Logger {
    * @param context Optional context object
    */
   error(message: string, context?: Record<string, unknown>): void {
-    if (this.level <= LogLevel.ERROR) {
-      console.error(`${this.prefix}${message}`, context || '');
+    this.log(LogLevel.ERROR, console.error, message, context);
+  }
+
+  /**
+   * Writes and records a message if its level passes the configured minimum
+   * Filtered messages cost neither console I/O nor a stored entry
+   */
+  private log(
+    level: LogLevel,
+    write: (message: string, context: Record<string, unknown> | string) => void,
+    message: string,
+    context?: Record<string, unknown>
+  ): void {
+    if (level < this.level) {
+      return;
     }
-    this.entries.push({ level: LogLevel.ERROR, message: `${this.prefix}${message}`, timestamp: new Date().toISOString(), context });
+    const prefixed = `${this.prefix}${message}`;
+    write(prefixed, context || '');
+    this.entries.push({ level, message: prefixed, timestamp: new Date().toISOString(), context });
   }
 
   /**
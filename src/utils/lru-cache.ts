@@ -0,0 +1,52 @@
+/**
+ * LRU Cache Utility
+ *
+ * A size-bounded in-memory cache that evicts the least recently used entry
+ * once full. Relies on Map preserving insertion order.
+ */
+
+export class LruCache<K, V> {
+  private readonly entries = new Map<K, V>();
+  private readonly maxSize: number;
+
+  /**
+   * Creates a new LRU cache
+   *
+   * @param maxSize Maximum number of entries kept in memory
+   */
+  constructor(maxSize: number) {
+    this.maxSize = maxSize;
+  }
+
+  /**
+   * Returns the cached value for a key and marks it as most recently used
+   */
+  get(key: K): V | undefined {
+    const value = this.entries.get(key);
+    if (value !== undefined) {
+      this.entries.delete(key);
+      this.entries.set(key, value);
+    }
+    return value;
+  }
+
+  /**
+   * Stores a value, evicting the least recently used entry when full
+   */
+  set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+
+    if (this.entries.size > this.maxSize) {
+      const oldestKey = this.entries.keys().next().value as K;
+      this.entries.delete(oldestKey);
+    }
+  }
+
+  /**
+   * Number of entries currently cached
+   */
+  get size(): number {
+    return this.entries.size;
+  }
+}
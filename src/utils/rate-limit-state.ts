@@ -0,0 +1,79 @@
+/**
+ * Rate Limit State Utility
+ *
+ * Tracks the remaining request budget reported by an API through its
+ * X-RateLimit-* response headers, so callers can pause until the window
+ * resets only when the budget is actually running low.
+ */
+
+import { sleep } from './http';
+
+interface RateLimitWindow {
+  limit: number;
+  remaining: number;
+  resetTime: number; // Epoch milliseconds
+}
+
+type ResponseHeaders = Record<string, string | number | undefined>;
+
+// Resource name used when the API does not report one
+const DEFAULT_RESOURCE = 'core';
+
+export class RateLimitState {
+  private readonly windows = new Map<string, RateLimitWindow>();
+  private readonly safetyRatio: number;
+
+  /**
+   * Creates a new rate limit state
+   *
+   * @param safetyRatio Fraction of a window's limit to keep in reserve before waiting for its reset
+   */
+  constructor(safetyRatio: number) {
+    this.safetyRatio = safetyRatio;
+  }
+
+  /**
+   * Records the budget reported by a response's X-RateLimit-* headers
+   * Each resource (e.g. core, search, graphql) is tracked separately
+   */
+  updateFromHeaders(headers: ResponseHeaders): void {
+    const limit = Number(headers['x-ratelimit-limit']);
+    const remaining = Number(headers['x-ratelimit-remaining']);
+    const reset = Number(headers['x-ratelimit-reset']);
+
+    if (!Number.isFinite(limit) || !Number.isFinite(remaining) || !Number.isFinite(reset)) {
+      return;
+    }
+
+    const resource = String(headers['x-ratelimit-resource'] || DEFAULT_RESOURCE);
+    this.windows.set(resource, { limit, remaining, resetTime: reset * 1000 });
+  }
+
+  /**
+   * Returns how long to wait (in ms) before a resource's budget is healthy again, 0 if it already is
+   * Each resource has its own window, so an exhausted search budget does not hold back core requests
+   *
+   * @param resource Rate limit resource the next request counts against (e.g. core, search, graphql)
+   */
+  getWaitTime(resource: string = DEFAULT_RESOURCE, now: number = Date.now()): number {
+    const window = this.windows.get(resource);
+    if (!window || window.remaining >= window.limit * this.safetyRatio || window.resetTime <= now) {
+      return 0;
+    }
+    return window.resetTime - now;
+  }
+
+  /**
+   * Waits until a resource's rate limit window has reset, if it is running low
+   *
+   * @param resource Rate limit resource the next request counts against
+   * @returns The time waited in milliseconds
+   */
+  async waitIfNeeded(resource: string = DEFAULT_RESOURCE): Promise<number> {
+    const waitTime = this.getWaitTime(resource);
+    if (waitTime > 0) {
+      await sleep(waitTime);
+    }
+    return waitTime;
+  }
+}
@@ -43,18 +43,16 @@ export class RateLimiter {
    */
   async acquire(): Promise<void> {
     this.refill();
-    
-    if (this.tokens >= 1) {
-      this.tokens -= 1;
+
+    // Reserve the token up front so concurrent callers queue behind each other
+    this.tokens -= 1;
+    if (this.tokens >= 0) {
       return;
     }
-    
-    // Calculate time to wait for next token
-    const waitTime = Math.ceil((1 - this.tokens) / this.refillRate);
+
+    // Wait until the bucket has refilled enough to cover this reservation
+    const waitTime = Math.ceil(-this.tokens / this.refillRate);
     await new Promise(resolve => setTimeout(resolve, waitTime));
-    
-    this.refill();
-    this.tokens -= 1;
   }
 
   /**